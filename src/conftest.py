@@ -42,9 +42,15 @@ def cache_dirs(tmp_path: pathlib.Path) -> pathlib.Path:
 class FakeLLM:
     """A minimal stand-in for LLMBroker used in tests.
 
-    It returns the provided object_model instantiated from a predetermined payload.
+    It returns the provided object_model instantiated from a predetermined payload,
+    or a canned default per supported model when no payload is given.
     """
 
+    _DEFAULTS: t.ClassVar[dict[type, t.Callable[[], object]]] = {
+        ProposedName: lambda: make_proposed_name(stem="primary-subject--specific-detail"),
+        ImageAnalysis: lambda: make_analysis(stem="primary-subject--specific-detail", reasoning="Test reasoning"),
+    }
+
     def __init__(self, payload: dict | None = None):
         self.payload = payload or {}
         self.calls: list[tuple[list[dict] | list[object], t.Any]] = []
@@ -52,15 +58,11 @@ class FakeLLM:
     def generate_object(self, messages, object_model):  # noqa: D401 - external contract
         """Record call and return a constructed pydantic model object."""
         self.calls.append((messages, object_model))
-        if object_model is ProposedName:
-            if self.payload:
-                return ProposedName(**self.payload)
-            return make_proposed_name(stem="primary-subject--specific-detail")
-        if object_model is ImageAnalysis:
-            if self.payload:
-                return ImageAnalysis(**self.payload)
-            return make_analysis(stem="primary-subject--specific-detail", reasoning="Test reasoning")
-        raise AssertionError("Unexpected object_model requested")
+        try:
+            default = self._DEFAULTS[object_model]
+        except KeyError:
+            raise AssertionError("Unexpected object_model requested") from None
+        return object_model(**self.payload) if self.payload else default()
 
 
 @pytest.fixture
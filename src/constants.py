@@ -8,7 +8,7 @@ from typing import Final
 # Single source of truth for rubric/cache version. Increment when cache schema changes.
 RUBRIC_VERSION: int = 1
 
-SUPPORTED_EXTENSIONS: Final[set[str]] = {
+SUPPORTED_EXTENSIONS: Final[frozenset[str]] = frozenset({
     ".png",
     ".jpg",
     ".jpeg",
@@ -17,7 +17,12 @@ SUPPORTED_EXTENSIONS: Final[set[str]] = {
     ".bmp",
     ".tif",
     ".tiff",
-}
+})
+# Sorted once for user-facing messages; use SUPPORTED_EXTENSIONS for membership tests.
+SUPPORTED_EXTENSIONS_SORTED: Final[tuple[str, ...]] = tuple(sorted(SUPPORTED_EXTENSIONS))
+
+# Longest edge (pixels) of images sent to the vision model; larger images are downscaled first.
+MAX_UPLOAD_EDGE: Final[int] = 1024
 
 SUPPORTED_PROVIDERS: Final[tuple[str, ...]] = ("ollama", "openai")
 DEFAULT_MODELS: Final[dict[str, str]] = {"ollama": "gemma3:27b", "openai": "gpt-4o"}
@@ -13,33 +13,45 @@ import typer
 from rich.console import Console
 from rich.panel import Panel
 
-from constants import FILESYSTEM_IO_ERRORS, LLM_OPERATIONAL_ERRORS, SUPPORTED_EXTENSIONS, SUPPORTED_PROVIDERS
+from constants import (
+    FILESYSTEM_IO_ERRORS,
+    LLM_OPERATIONAL_ERRORS,
+    SUPPORTED_EXTENSIONS,
+    SUPPORTED_EXTENSIONS_SORTED,
+    SUPPORTED_PROVIDERS,
+)
 from operations.adapters import FilesystemMarkdownFiles, FilesystemRenamer
 from operations.apply_renames import apply_renames, apply_single_file_command
 from operations.batch_references import process_batch_references
-from operations.display import display_results_table, print_reference_result, print_statistics
-from operations.gateway_factory import MissingApiKeyError
+from operations.display import print_error_line, print_reference_result, print_statistics, stream_results_table
+from operations.gateway_factory import MissingApiKeyError, require_api_key
 from operations.models import (
+    PlannedNames,
     ProcessingResult,
     RenameStatus,
 )
 from operations.rename_status_display import RENAME_STATUS_PRESENTATION
 from operations.pipeline_factory import AnalysisPipeline, build_analysis_pipeline
-from operations.process_folder import process_folder
-from operations.process_image import process_single_image
-from utils.fs import collect_image_files, ensure_cache_layout
+from operations.process_folder import iter_process_folder
+from operations.process_image import build_rubric_skip_result, follows_naming_rubric, process_single_image
+from utils.fs import collect_image_files, ensure_cache_layout, image_extension
 
 logging.basicConfig(level=logging.WARNING)
 
-# Runtime Python version enforcement (see REVIEW.md #12)
-if sys.version_info < (3, 13):  # pragma: no cover - defensive
-    raise RuntimeError("Requires Python 3.13+")
-
 Provider = Annotated[str, typer.Option("--provider", help="Model provider: ollama or openai", envvar="LLM_PROVIDER")]
 Model = Annotated[str, typer.Option(
     "--model", help="Visual model to use (default aligns with Ollama gemma3:27b)", envvar="LLM_MODEL"
 )]
 DryRun = Annotated[bool, typer.Option("--dry-run/--apply", help="Preview only vs. actually rename")]
+UpdateRefs = Annotated[bool, typer.Option(
+    "--update-refs/--no-update-refs", help="Update markdown/wiki references when renaming"
+)]
+RefsRoot = Annotated[Path | None, typer.Option(
+    "--refs-root", help="Root directory for reference updates (defaults to file's directory)", file_okay=False
+)]
+Force = Annotated[bool, typer.Option(
+    "--force", help="Analyze images even when their names already follow the naming rubric"
+)]
 
 app = typer.Typer(help="Rename image files based on their visual contents.")
 console = Console()
@@ -54,18 +66,24 @@ def _configure_logging(
 
 
 def _validate_file_type(path: Path) -> None:
-    suffix = path.suffix.lower()
+    suffix = image_extension(path.name)
     if suffix not in SUPPORTED_EXTENSIONS:
         console.print(
-            f"[red]Unsupported file type '{suffix}'. Supported: {sorted(SUPPORTED_EXTENSIONS)}[/red]"
+            f"[red]Unsupported file type '{suffix}'. Supported: {', '.join(SUPPORTED_EXTENSIONS_SORTED)}[/red]"
         )
         raise typer.Exit(2)
 
 
 def _validate_provider(provider: str) -> None:
+    """Reject an unknown provider or missing API key before any files are scanned or cached."""
     if provider not in SUPPORTED_PROVIDERS:
         console.print(f"[red]Invalid provider: {provider}[/red]")
         raise typer.Exit(2)
+    try:
+        require_api_key(provider)
+    except MissingApiKeyError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(2)
 
 
 def _prepare_cache_root_or_exit(root: Path) -> Path:
@@ -98,11 +116,12 @@ def _build_pipeline_or_exit(provider: str, model: str, cache_root: Path) -> Anal
         raise typer.Exit(1)
 
 
-def _apply_renames(results: list[ProcessingResult]) -> None:
-    rename_result = apply_renames(results, FilesystemRenamer())
+def _apply_renames(results: list[ProcessingResult], concurrency: int) -> None:
+    with FilesystemRenamer() as renamer:
+        rename_result = apply_renames(results, renamer, concurrency=concurrency)
     if rename_result.failures:
         for f in rename_result.failures:
-            console.print(f"[red]✗ Failed to rename {f.source}: {f.error}[/red]")
+            print_error_line(console, f"✗ Failed to rename {f.source}: {f.error}")
     if rename_result.applied:
         console.print(f"[green]✓ {rename_result.applied} rename(s) applied.[/green]")
 
@@ -115,14 +134,17 @@ def _apply_single_rename(path: Path, final_name: str) -> None:
             console.print(f"[red]✗ Failed to rename {path.name}: {e}[/red]")
 
 
-def _process_single_file(path: Path, provider: str, model: str) -> ProcessingResult:
+def _process_single_file(path: Path, provider: str, model: str, *, force: bool) -> ProcessingResult:
     _validate_file_type(path)
     _validate_provider(provider)
 
+    if not force and follows_naming_rubric(path):
+        return build_rubric_skip_result(path)
+
     cache_root = _prepare_cache_root_or_exit(Path.cwd())
     pipeline = _build_pipeline_or_exit(provider, model, cache_root)
 
-    result = process_single_image(path, pipeline.analyzer, pipeline.cache, set())
+    result = process_single_image(path, pipeline.analyzer, pipeline.cache, PlannedNames())
 
     if result.status == RenameStatus.ERROR:
         console.print(f"[red]Error processing {path.name}[/red]")
@@ -139,16 +161,12 @@ def file(
     provider: Provider = "ollama",
     model: Model = "gemma3:27b",
     dry_run: DryRun = True,
-    update_refs: bool = typer.Option(
-        False, "--update-refs/--no-update-refs", help="Update markdown/wiki references when renaming"
-    ),
-    refs_root: Path | None = typer.Option(
-        None, "--refs-root", help="Root directory for reference updates (defaults to file's directory)",
-        file_okay=False
-    ),
+    update_refs: UpdateRefs = False,
+    refs_root: RefsRoot = None,
+    force: Force = False,
 ) -> None:
     """Rename a single file based on its visual contents."""
-    result = _process_single_file(path, provider, model)
+    result = _process_single_file(path, provider, model, force=force)
 
     mode_label = RENAME_STATUS_PRESENTATION[result.status].cli_label
 
@@ -185,13 +203,15 @@ def folder(
     recursive: bool = typer.Option(
         False, "--recursive", help="Process subdirectories recursively"
     ),
-    update_refs: bool = typer.Option(
-        False, "--update-refs/--no-update-refs", help="Update markdown/wiki references when renaming"
+    update_refs: UpdateRefs = False,
+    refs_root: RefsRoot = None,
+    concurrency: int = typer.Option(
+        4, "--concurrency", min=1, help="Number of images to analyze (and rename) in parallel"
     ),
-    refs_root: Path | None = typer.Option(
-        None, "--refs-root", help="Root directory for reference updates (defaults to file's directory)",
-        file_okay=False
+    batch: int = typer.Option(
+        1, "--batch", min=1, help="Number of images to send to the model per request"
     ),
+    force: Force = False,
 ) -> None:
     """Rename all images in a directory based on their visual contents."""
     _validate_provider(provider)
@@ -206,9 +226,14 @@ def folder(
     cache_root = _prepare_cache_root_or_exit(Path.cwd())
     pipeline = _build_pipeline_or_exit(provider, model, cache_root)
 
-    results = process_folder(image_files, pipeline.analyzer, pipeline.cache)
-
-    display_results_table(console, results, dry_run)
+    results = stream_results_table(
+        console,
+        iter_process_folder(
+            image_files, pipeline.analyzer, pipeline.cache,
+            concurrency=concurrency, skip_conforming=not force, batch_size=batch,
+        ),
+        dry_run,
+    )
     print_statistics(console, results)
 
     if update_refs:
@@ -218,7 +243,7 @@ def folder(
         print_reference_result(console, ref_result, dry_run)
 
     if not dry_run:
-        _apply_renames(results)
+        _apply_renames(results, concurrency)
 
 
 @app.command()
@@ -231,7 +256,7 @@ def generate(
     dry_run: DryRun = True,
 ) -> None:
     """Propose a new filename for a given image file."""
-    result = _process_single_file(path, provider, model)
+    result = _process_single_file(path, provider, model, force=True)
 
     console.print(
         Panel.fit(
@@ -252,6 +277,10 @@ def generate(
 
 
 def main() -> None:
+    # Runtime Python version enforcement (see REVIEW.md #12). Checked here rather
+    # than at import so merely importing the module (tests, tooling) skips it.
+    if sys.version_info < (3, 13):  # pragma: no cover - defensive
+        raise RuntimeError("Requires Python 3.13+")
     app()
 
 
@@ -27,3 +27,28 @@ def should_reject_invalid_provider(tmp_path: Path) -> None:
 
     assert result.exit_code == 2
     assert "Invalid provider" in result.output
+
+
+def should_reject_missing_api_key_before_preparing_cache(tmp_path: Path, monkeypatch, mocker) -> None:
+    src = tmp_path / "a.png"
+    src.write_bytes(b"x")
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    prepare = mocker.patch.object(cli, "ensure_cache_layout")
+
+    result = runner.invoke(cli.app, ["file", str(src), "--provider", "openai"])
+
+    assert result.exit_code == 2
+    assert "OPENAI_API_KEY" in result.output
+    prepare.assert_not_called()
+
+
+def should_skip_analysis_when_name_follows_rubric(tmp_path: Path, mocker) -> None:
+    src = tmp_path / "sales-chart--quarterly-revenue-2024.png"
+    src.write_bytes(b"x")
+    build = mocker.patch.object(cli, "build_analysis_pipeline")
+
+    result = runner.invoke(cli.app, ["file", str(src)])
+
+    assert result.exit_code == 0
+    assert "sales-chart--quarterly-revenue-2024.png" in result.output
+    build.assert_not_called()
@@ -0,0 +1,30 @@
+"""CLI integration tests for the Typer application as a whole."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import main as cli
+
+
+def should_register_each_command_once() -> None:
+    names = [c.name or c.callback.__name__ for c in cli.app.registered_commands if c.callback is not None]
+
+    assert sorted(names) == ["file", "folder", "generate"]
+
+
+def should_not_import_llm_stack_when_cli_module_loads() -> None:
+    src_dir = Path(cli.__file__).parent
+    probe = (
+        "import sys, main; "
+        "print(sorted(m for m in sys.modules if m.split('.')[0] == 'mojentic' or m == 'rich.table'))"
+    )
+
+    completed = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=src_dir, env={**os.environ, "PYTHONPATH": str(src_dir)},
+        capture_output=True, text=True, check=True,
+    )
+
+    assert completed.stdout.strip() == "[]"
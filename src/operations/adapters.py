@@ -1,16 +1,22 @@
+import logging
 import os
 import shutil
 import tempfile
+import threading
 from collections.abc import Callable
 from pathlib import Path
-
-from mojentic.llm import LLMBroker
+from typing import TYPE_CHECKING
 
 from constants import FILESYSTEM_IO_ERRORS
-from operations.analyze_image import analyze_image
+from operations.analyze_image import analyze_image, analyze_images
 from operations.cache import load_analysis_from_cache, save_analysis_to_cache
 from operations.models import ImageAnalysis
-from utils.fs import ensure_cache_layout
+from utils.fs import ensure_cache_layout, iter_markdown_files
+
+if TYPE_CHECKING:
+    from mojentic.llm import LLMBroker
+
+logger = logging.getLogger(__name__)
 
 
 class FilesystemAnalysisCache:
@@ -44,27 +50,100 @@ class FilesystemAnalysisCache:
 
 
 class MojenticImageAnalyzer:
-    """Wraps analyze_image, binding the LLMBroker at construction time."""
+    """Wraps analyze_image and analyze_images, binding the LLMBroker at construction time."""
 
-    def __init__(self, llm: LLMBroker, *, analyze_fn: Callable[..., ImageAnalysis] = analyze_image) -> None:
+    def __init__(
+        self,
+        llm: "LLMBroker",
+        *,
+        analyze_fn: Callable[..., ImageAnalysis] = analyze_image,
+        analyze_batch_fn: Callable[..., list[ImageAnalysis]] = analyze_images,
+        prepare_fn: Callable[[Path], Path] | None = None,
+    ) -> None:
         self._llm = llm
         self._analyze_fn = analyze_fn
+        self._analyze_batch_fn = analyze_batch_fn
+        self._prepare_fn = prepare_fn
 
     def analyze(
         self,
         path: Path,
         current_name: str,
     ) -> ImageAnalysis:
-        """Invoke the bound analyze function with the bound LLMBroker."""
-        return self._analyze_fn(path, current_name, llm=self._llm)
+        """Invoke the bound analyze function with the bound LLMBroker.
+
+        When a ``prepare_fn`` is bound, the image it returns (e.g. a downscaled
+        copy) is sent in place of ``path``; ``current_name`` is passed unchanged.
+        """
+        return self._analyze_fn(self._prepare(path), current_name, llm=self._llm)
+
+    def analyze_batch(
+        self,
+        paths: list[Path],
+        current_names: list[str],
+    ) -> list[ImageAnalysis]:
+        """Invoke the bound batch analyze function with the bound LLMBroker."""
+        return self._analyze_batch_fn([self._prepare(p) for p in paths], current_names, llm=self._llm)
+
+    def _prepare(self, path: Path) -> Path:
+        return path if self._prepare_fn is None else self._prepare_fn(path)
+
+
+_DIR_FD_RENAME_SUPPORTED = os.rename in os.supports_dir_fd and hasattr(os, "O_DIRECTORY")
 
 
 class FilesystemRenamer:
-    """Filesystem-backed FileRenamerPort implementation."""
+    """Filesystem-backed FileRenamerPort implementation.
+
+    Used as a context manager, consecutive renames within one directory share a
+    single open directory descriptor (where ``os.rename`` supports ``dir_fd``),
+    so the kernel resolves the parent path once per directory rather than twice
+    per rename. Outside a ``with`` block every rename resolves full paths.
+    Descriptors are cached per thread, so one instance may be shared by
+    concurrent renames; all of them are closed when the block exits.
+    """
+
+    def __init__(self) -> None:
+        self._batching = False
+        self._local = threading.local()
+        self._open_fds: set[int] = set()
+        self._fds_lock = threading.Lock()
+
+    def __enter__(self) -> "FilesystemRenamer":
+        self._batching = _DIR_FD_RENAME_SUPPORTED
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._batching = False
+        with self._fds_lock:
+            for fd in self._open_fds:
+                os.close(fd)
+            self._open_fds.clear()
+        self._local = threading.local()
 
     def rename(self, source: Path, destination: Path) -> None:
         """Rename source to destination using the filesystem."""
-        source.rename(destination)
+        if not self._batching or source.parent != destination.parent:
+            source.rename(destination)
+            return
+        dir_fd = self._open_dir_fd(source.parent)
+        os.rename(source.name, destination.name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+
+    def _open_dir_fd(self, directory: Path) -> int:
+        local = self._local
+        if getattr(local, "dir", None) == directory:
+            fd: int = local.fd
+            return fd
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        with self._fds_lock:
+            previous = getattr(local, "fd", None)
+            if previous is not None:
+                self._open_fds.discard(previous)
+                os.close(previous)
+            self._open_fds.add(fd)
+        local.dir = directory
+        local.fd = fd
+        return fd
 
 
 class FilesystemCacheClearer:
@@ -91,9 +170,15 @@ class FilesystemMarkdownFiles:
     """Thin I/O wrapper with no business logic."""
 
     def find_markdown_files(self, root: Path, *, recursive: bool) -> list[Path]:
-        """Glob for .md files under root; searches all subdirectories when recursive is True."""
-        pattern = "**/*.md" if recursive else "*.md"
-        return [p for p in root.glob(pattern) if p.is_file()]
+        """List .md files under root via os.scandir; searches all subdirectories when recursive is True.
+
+        A missing or unreadable root yields no files, as ``Path.glob`` did.
+        """
+        try:
+            return list(iter_markdown_files(root, recursive))
+        except FILESYSTEM_IO_ERRORS as e:
+            logger.warning("Cannot list markdown files in %s: %s: %s", root, type(e).__name__, e)
+            return []
 
     def read_markdown_content(self, file_path: Path) -> str:
         """Read UTF-8 text; opens with explicit encoding for cross-platform safety."""
@@ -1,6 +1,7 @@
 """Tests for concrete adapter implementations."""
 
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from conftest import make_analysis
@@ -62,7 +63,7 @@ def should_persist_analysis_to_cache_directory(
 
     cache.save(tmp_image_path, "sample.png", analysis)
 
-    json_files = list(cache_dir.glob("*.json"))
+    json_files = list(cache_dir.glob("*/*.json"))
     assert len(json_files) >= 1
 
 
@@ -107,6 +108,38 @@ def should_return_image_analysis_result(
     assert result is expected
 
 
+def should_delegate_analyze_batch_to_analyze_images(mock_llm, mocker, tmp_image_path: Path):
+    expected = [make_analysis(suitable=False, stem="golden-retriever--running-in-park")]
+    mock_analyze_batch = mocker.Mock(return_value=expected)
+    analyzer = MojenticImageAnalyzer(mock_llm, analyze_batch_fn=mock_analyze_batch)
+
+    result = analyzer.analyze_batch([tmp_image_path], ["sample.png"])
+
+    assert result is expected
+    mock_analyze_batch.assert_called_once_with([tmp_image_path], ["sample.png"], llm=mock_llm)
+
+
+def should_send_prepared_image_with_original_name(mock_llm, mock_analyze, tmp_path: Path, tmp_image_path: Path):
+    prepared = tmp_path / "resized.jpg"
+    analyzer = MojenticImageAnalyzer(mock_llm, analyze_fn=mock_analyze, prepare_fn=lambda p: prepared)
+
+    analyzer.analyze(tmp_image_path, "sample.png")
+
+    mock_analyze.assert_called_once_with(prepared, "sample.png", llm=mock_llm)
+
+
+def should_send_prepared_images_in_batch(mock_llm, mocker, tmp_path: Path, tmp_image_path: Path):
+    prepared = tmp_path / "resized.jpg"
+    mock_analyze_batch = mocker.Mock(return_value=[])
+    analyzer = MojenticImageAnalyzer(
+        mock_llm, analyze_batch_fn=mock_analyze_batch, prepare_fn=lambda p: prepared
+    )
+
+    analyzer.analyze_batch([tmp_image_path], ["sample.png"])
+
+    mock_analyze_batch.assert_called_once_with([prepared], ["sample.png"], llm=mock_llm)
+
+
 # ---------------------------------------------------------------------------
 # FilesystemRenamer
 # ---------------------------------------------------------------------------
@@ -137,6 +170,51 @@ def should_preserve_file_contents_after_rename(tmp_path: Path, renamer: Filesyst
     assert destination.read_bytes() == b"image-data"
 
 
+def should_rename_files_in_same_directory_when_batching(tmp_path: Path):
+    first = tmp_path / "a.png"
+    second = tmp_path / "b.png"
+    first.write_bytes(b"a")
+    second.write_bytes(b"b")
+
+    with FilesystemRenamer() as renamer:
+        renamer.rename(first, tmp_path / "first.png")
+        renamer.rename(second, tmp_path / "second.png")
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["first.png", "second.png"]
+
+
+def should_rename_files_across_directories_when_batching(tmp_path: Path):
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    (tmp_path / "a.png").write_bytes(b"a")
+    (sub / "b.png").write_bytes(b"b")
+
+    with FilesystemRenamer() as renamer:
+        renamer.rename(tmp_path / "a.png", tmp_path / "first.png")
+        renamer.rename(sub / "b.png", sub / "second.png")
+
+    assert (tmp_path / "first.png").read_bytes() == b"a"
+    assert (sub / "second.png").read_bytes() == b"b"
+
+
+def should_rename_concurrently_from_threads_when_batching(tmp_path: Path):
+    sources = [tmp_path / f"img{i}.png" for i in range(16)]
+    for src in sources:
+        src.write_bytes(b"x")
+
+    with FilesystemRenamer() as renamer:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda src: renamer.rename(src, src.with_name(f"new-{src.name}")), sources))
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(f"new-{src.name}" for src in sources)
+
+
+def should_raise_oserror_when_batched_source_missing(tmp_path: Path):
+    with FilesystemRenamer() as renamer:
+        with pytest.raises(OSError):
+            renamer.rename(tmp_path / "missing.png", tmp_path / "other.png")
+
+
 # ---------------------------------------------------------------------------
 # FilesystemMarkdownFiles
 # ---------------------------------------------------------------------------
@@ -195,6 +273,14 @@ def should_not_include_non_md_files(
     assert all(p.suffix == ".md" for p in result)
 
 
+def should_return_empty_list_when_markdown_root_missing(
+    tmp_path: Path, markdown_files: FilesystemMarkdownFiles
+):
+    result = markdown_files.find_markdown_files(tmp_path / "missing", recursive=True)
+
+    assert result == []
+
+
 def should_return_file_content(
     tmp_path: Path, markdown_files: FilesystemMarkdownFiles
 ):
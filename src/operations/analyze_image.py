@@ -1,12 +1,21 @@
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING, Final, cast
 
-from mojentic.llm import LLMBroker, MessageBuilder
+from operations.models import BatchImageAnalysis, ImageAnalysis
 
-from operations.models import ImageAnalysis
+if TYPE_CHECKING:
+    from mojentic.llm import LLMBroker
+    from mojentic.llm.gateways.models import LLMMessage
 
 
-UNIFIED_PROMPT = (
+class BatchResponseMismatchError(Exception):
+    """Raised when a batch response does not cover each requested image exactly once."""
+
+
+# Sent verbatim as the system message of every request. Keep it free of per-image
+# text so servers that reuse a cached prompt prefix (Ollama, OpenAI) can skip
+# re-processing it; per-image details go in the user message that follows.
+UNIFIED_PROMPT: Final[str] = (
     "You are an expert at analyzing and naming image files for clarity and organization.\n"
     "\n"
     "Your task is to:\n"
@@ -33,20 +42,77 @@ UNIFIED_PROMPT = (
 def analyze_image(
     path: Path,
     current_name: str,
-    llm: LLMBroker,
-    message_builder: type = MessageBuilder,
+    llm: "LLMBroker",
+    message_builder: type | None = None,
 ) -> ImageAnalysis:
     """Analyze an image and provide assessment + naming in a single LLM call.
 
     Replaces the two-call pattern (assess_name + generate_name) with a single
-    unified call that returns both pieces of information.
+    unified call that returns both pieces of information. ``message_builder``
+    defaults to mojentic's ``MessageBuilder``, imported on first use.
     """
-    prompt = f"{UNIFIED_PROMPT}\n\nCurrent filename: '{current_name}'"
+    if message_builder is None:
+        from mojentic.llm import MessageBuilder
+        message_builder = MessageBuilder
 
     messages = [
-        message_builder(prompt)
+        _system_message(),
+        message_builder(f"Current filename: '{current_name}'")
         .add_image(path)
-        .build()
+        .build(),
     ]
 
     return cast(ImageAnalysis, llm.generate_object(messages, object_model=ImageAnalysis))
+
+
+def analyze_images(
+    paths: list[Path],
+    current_names: list[str],
+    llm: "LLMBroker",
+    message_builder: type | None = None,
+) -> list[ImageAnalysis]:
+    """Analyze several images in one LLM call, returning one analysis per path in order.
+
+    Sends the unified prompt once with every image attached, so prompt tokens
+    and the HTTP round-trip are shared by the whole batch. Raises
+    BatchResponseMismatchError when the response does not cover each image
+    exactly once.
+    """
+    if message_builder is None:
+        from mojentic.llm import MessageBuilder
+        message_builder = MessageBuilder
+
+    listing = "\n".join(
+        f"Image {number}: current filename '{name}'"
+        for number, name in enumerate(current_names, start=1)
+    )
+    prompt = (
+        f"You are given {len(paths)} images, attached in the order listed below. "
+        "Apply the task to each image independently and return one analysis per image, "
+        "setting image_number to the image's position in this list.\n\n"
+        f"{listing}"
+    )
+
+    messages = [
+        _system_message(),
+        message_builder(prompt)
+        .add_images(*paths)
+        .build(),
+    ]
+
+    batch = cast(BatchImageAnalysis, llm.generate_object(messages, object_model=BatchImageAnalysis))
+    by_number = {item.image_number: item for item in batch.analyses}
+    if len(batch.analyses) != len(paths) or set(by_number) != set(range(1, len(paths) + 1)):
+        raise BatchResponseMismatchError(
+            f"Batch response covered images {sorted(by_number)} for a request of {len(paths)} image(s)"
+        )
+    return [
+        ImageAnalysis.model_validate(by_number[number].model_dump(exclude={"image_number"}))
+        for number in range(1, len(paths) + 1)
+    ]
+
+
+def _system_message() -> "LLMMessage":
+    from mojentic.llm.gateways.models import LLMMessage, MessageRole
+
+    return LLMMessage(role=MessageRole.System, content=UNIFIED_PROMPT)
@@ -1,8 +1,9 @@
 import pytest
+from mojentic.llm.gateways.models import MessageRole
 
 from conftest import make_analysis
-from operations.analyze_image import UNIFIED_PROMPT, analyze_image
-from operations.models import ImageAnalysis
+from operations.analyze_image import UNIFIED_PROMPT, BatchResponseMismatchError, analyze_image, analyze_images
+from operations.models import BatchImageAnalysis, BatchImageAnalysisItem, ImageAnalysis
 
 
 class _FakeMessage:
@@ -12,6 +13,10 @@ class _FakeMessage:
     def add_image(self, path):
         return self
 
+    def add_images(self, *paths):
+        self.images = paths
+        return self
+
     def build(self):
         return {"prompt": self._prompt}
 
@@ -32,19 +37,29 @@ def mock_llm(mocker, fake_analysis):
     return llm
 
 
-def should_call_llm_with_unified_prompt(tmp_image_path, mock_llm):
+def should_send_unified_prompt_verbatim_as_system_message(tmp_image_path, mock_llm):
     analyze_image(tmp_image_path, "sample.png", llm=mock_llm, message_builder=_FakeMessage)
 
     mock_llm.generate_object.assert_called_once()
-    messages = mock_llm.generate_object.call_args[0][0]
-    assert UNIFIED_PROMPT in messages[0]["prompt"]
+    system = mock_llm.generate_object.call_args[0][0][0]
+    assert system.role == MessageRole.System
+    assert system.content == UNIFIED_PROMPT
 
 
-def should_include_current_filename_in_prompt(tmp_image_path, mock_llm):
+def should_include_current_filename_in_user_message(tmp_image_path, mock_llm):
     analyze_image(tmp_image_path, "my-photo.jpg", llm=mock_llm, message_builder=_FakeMessage)
 
     messages = mock_llm.generate_object.call_args[0][0]
-    assert "my-photo.jpg" in messages[0]["prompt"]
+    assert "my-photo.jpg" in messages[1]["prompt"]
+    assert UNIFIED_PROMPT not in messages[1]["prompt"]
+
+
+def should_send_identical_system_message_for_every_image(tmp_image_path, mock_llm):
+    analyze_image(tmp_image_path, "a.png", llm=mock_llm, message_builder=_FakeMessage)
+    analyze_image(tmp_image_path, "b.png", llm=mock_llm, message_builder=_FakeMessage)
+
+    first, second = (c[0][0][0] for c in mock_llm.generate_object.call_args_list)
+    assert first == second
 
 
 def should_request_image_analysis_model(tmp_image_path, mock_llm):
@@ -62,3 +77,41 @@ def should_return_image_analysis_result(tmp_image_path, mock_llm, fake_analysis)
     assert isinstance(result, ImageAnalysis)
     assert result.proposed_name.stem == "golden-retriever--running-in-park"
     assert result.current_name_suitable is False
+
+
+def _batch_item(number: int, stem: str) -> BatchImageAnalysisItem:
+    return BatchImageAnalysisItem(image_number=number, **make_analysis(suitable=False, stem=stem).model_dump())
+
+
+def should_list_every_current_filename_in_batch_prompt(tmp_path, mock_llm):
+    paths = [tmp_path / "a.png", tmp_path / "b.png"]
+    mock_llm.generate_object.return_value = BatchImageAnalysis(analyses=[_batch_item(1, "x"), _batch_item(2, "y")])
+
+    analyze_images(paths, ["a.png", "b.png"], llm=mock_llm, message_builder=_FakeMessage)
+
+    system, user = mock_llm.generate_object.call_args[0][0]
+    prompt = user["prompt"]
+    assert system.content == UNIFIED_PROMPT
+    assert "Image 1: current filename 'a.png'" in prompt
+    assert "Image 2: current filename 'b.png'" in prompt
+    assert mock_llm.generate_object.call_args[1]["object_model"] is BatchImageAnalysis
+
+
+def should_return_batch_analyses_in_image_order(tmp_path, mock_llm):
+    paths = [tmp_path / "a.png", tmp_path / "b.png"]
+    mock_llm.generate_object.return_value = BatchImageAnalysis(
+        analyses=[_batch_item(2, "second"), _batch_item(1, "first")]
+    )
+
+    result = analyze_images(paths, ["a.png", "b.png"], llm=mock_llm, message_builder=_FakeMessage)
+
+    assert [type(a) for a in result] == [ImageAnalysis, ImageAnalysis]
+    assert [a.proposed_name.stem for a in result] == ["first", "second"]
+
+
+def should_raise_mismatch_error_when_batch_response_misses_an_image(tmp_path, mock_llm):
+    paths = [tmp_path / "a.png", tmp_path / "b.png"]
+    mock_llm.generate_object.return_value = BatchImageAnalysis(analyses=[_batch_item(1, "x"), _batch_item(1, "y")])
+
+    with pytest.raises(BatchResponseMismatchError):
+        analyze_images(paths, ["a.png", "b.png"], llm=mock_llm, message_builder=_FakeMessage)
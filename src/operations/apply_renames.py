@@ -1,6 +1,7 @@
 """Apply rename operations from processing results via an injected FileRenamerPort."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from constants import FILESYSTEM_IO_ERRORS
@@ -21,6 +22,8 @@ logger = logging.getLogger(__name__)
 def apply_renames(
     results: list[ProcessingResult],
     renamer: FileRenamerPort,
+    *,
+    concurrency: int = 1,
 ) -> RenameApplicationResult:
     """Apply renames for results with RENAMED or COLLISION status.
 
@@ -28,6 +31,11 @@ def apply_renames(
     - Status is RENAMED or COLLISION
     - A path is present
     - The final name differs from the current name
+
+    With ``concurrency`` above one, up to that many renames are in flight at
+    once, which helps on network filesystems; ``renamer`` must then be safe to
+    call from several threads. Planned final names never collide with existing
+    files or each other, so the renames are independent of their order.
     """
     rename_pairs = [
         (result.path, result.path.with_name(result.final))
@@ -36,16 +44,22 @@ def apply_renames(
         and result.path
         and result.path.with_name(result.final) != result.path
     ]
-    applied = 0
-    failures: list[RenameFailure] = []
-    for src, dst in rename_pairs:
-        try:
-            renamer.rename(src, dst)
-            applied += 1
-        except FILESYSTEM_IO_ERRORS as e:
-            logger.warning("Failed to rename %s -> %s: %s: %s", src, dst, type(e).__name__, e)
-            failures.append(RenameFailure(source=str(src), destination=str(dst), error=str(e)))
-    return RenameApplicationResult(applied=applied, failures=failures)
+    if concurrency > 1 and len(rename_pairs) > 1:
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(rename_pairs))) as executor:
+            outcomes = list(executor.map(lambda pair: _rename_one(renamer, *pair), rename_pairs))
+    else:
+        outcomes = [_rename_one(renamer, src, dst) for src, dst in rename_pairs]
+    failures = [failure for failure in outcomes if failure is not None]
+    return RenameApplicationResult(applied=len(outcomes) - len(failures), failures=failures)
+
+
+def _rename_one(renamer: FileRenamerPort, src: Path, dst: Path) -> RenameFailure | None:
+    try:
+        renamer.rename(src, dst)
+    except FILESYSTEM_IO_ERRORS as e:
+        logger.warning("Failed to rename %s -> %s: %s: %s", src, dst, type(e).__name__, e)
+        return RenameFailure(source=str(src), destination=str(dst), error=str(e))
+    return None
 
 
 def apply_rename_with_references(
@@ -60,7 +74,8 @@ def apply_rename_with_references(
 
     Short-circuits if the current filename already matches new_name. When
     markdown_files and search_root are provided, finds and updates all
-    markdown references to the renamed file.
+    markdown references to the renamed file, descending into subdirectories
+    of search_root only when recursive is set.
     """
     if old_path.name == new_name:
         return RenameOutcome(renamed=False, new_path=old_path, references_updated=0)
@@ -76,7 +91,7 @@ def apply_rename_with_references(
     references_updated = 0
     if markdown_files is not None and search_root is not None:
         ref_result = process_single_file_references(
-            old_path, new_name, search_root, markdown_files, dry_run=False
+            old_path, new_name, search_root, markdown_files, dry_run=False, recursive=recursive
         )
         references_updated = ref_result.total_references
 
@@ -98,13 +113,16 @@ def apply_single_file_command(
 
     Encapsulates dry-run branching, conditional adapter construction, and
     rename-failure detection so the CLI command body stays output-only.
+    Without an explicit ``refs_root``, only markdown files directly beside the
+    image are searched; an explicit root is searched recursively.
     """
     search_root = refs_root if refs_root is not None else path.parent
+    recursive = refs_root is not None
 
     if dry_run:
         if update_refs and final_name != path.name:
             ref_result = process_single_file_references(
-                path, final_name, search_root, markdown_files, dry_run=True
+                path, final_name, search_root, markdown_files, dry_run=True, recursive=recursive
             )
             return FileCommandOutcome(reference_result=ref_result)
         return FileCommandOutcome()
@@ -115,7 +133,7 @@ def apply_single_file_command(
         search_root if update_refs else None,
         renamer,
         markdown_files if update_refs else None,
-        recursive=False,
+        recursive=recursive,
     )
     rename_failed = final_name != path.name and not outcome.renamed
     return FileCommandOutcome(
@@ -1,3 +1,4 @@
+import threading
 from pathlib import Path
 
 from operations.apply_renames import apply_rename_with_references, apply_renames, apply_single_file_command
@@ -22,6 +23,31 @@ def should_rename_files_with_renamed_status(tmp_path, mock_renamer):
     mock_renamer.rename.assert_called_once_with(img, img.with_name("new.png"))
 
 
+def should_rename_concurrently_and_report_failures_in_order(tmp_path, mock_renamer):
+    imgs = [tmp_path / f"img{i}.png" for i in range(3)]
+    results = [
+        ProcessingResult(
+            source=img.name, proposed=f"new-{img.name}", final=f"new-{img.name}",
+            status=RenameStatus.RENAMED, path=img,
+        )
+        for img in imgs
+    ]
+    barrier = threading.Barrier(2, timeout=5)
+
+    def rename(src, dst):
+        if src != imgs[2]:
+            barrier.wait()
+        if src == imgs[1]:
+            raise OSError("locked")
+
+    mock_renamer.rename.side_effect = rename
+
+    result = apply_renames(results, mock_renamer, concurrency=2)
+
+    assert result.applied == 2
+    assert [f.source for f in result.failures] == [str(imgs[1])]
+
+
 def should_rename_files_with_collision_status(tmp_path, mock_renamer):
     img = tmp_path / "old.png"
     img.write_bytes(b"x")
@@ -317,3 +343,27 @@ def should_propagate_reference_result_on_apply_with_update_refs(tmp_path, mock_r
 
     assert result.renamed is True
     assert result.reference_result is not None
+
+
+def should_search_only_image_directory_when_refs_root_not_given(tmp_path, mock_renamer, mock_markdown_files):
+    img = tmp_path / "old.png"
+    img.write_bytes(b"x")
+    mock_markdown_files.find_markdown_files.return_value = []
+
+    apply_single_file_command(img, "new.png", True, None, True, mock_renamer, mock_markdown_files)
+    apply_single_file_command(img, "new.png", True, None, False, mock_renamer, mock_markdown_files)
+
+    for call in mock_markdown_files.find_markdown_files.call_args_list:
+        assert call.args == (tmp_path,)
+        assert call.kwargs == {"recursive": False}
+
+
+def should_search_refs_root_recursively_when_given(tmp_path, mock_renamer, mock_markdown_files):
+    img = tmp_path / "old.png"
+    img.write_bytes(b"x")
+    refs_root = tmp_path / "notes"
+    mock_markdown_files.find_markdown_files.return_value = []
+
+    apply_single_file_command(img, "new.png", True, refs_root, True, mock_renamer, mock_markdown_files)
+
+    mock_markdown_files.find_markdown_files.assert_called_once_with(refs_root, recursive=True)
@@ -2,7 +2,12 @@
 
 from pathlib import Path
 
-from operations.find_references import find_references, ref_matches_filename
+from operations.find_references import (
+    find_references,
+    ref_matches_filename,
+    scan_reference_candidates,
+    select_references,
+)
 from operations.models import (
     BatchReferenceResult,
     CollectedReferences,
@@ -35,7 +40,10 @@ def _collect_references(
     search_root: Path,
     markdown_files: MarkdownFilePort,
 ) -> CollectedReferences:
-    """Collect markdown references and rename map for RENAMED/COLLISION results where name differs."""
+    """Collect markdown references and rename map for RENAMED/COLLISION results where name differs.
+
+    Scans the markdown tree once and matches every renamed image against that scan.
+    """
     renamed = [
         (r.path, r.final) for r in results
         if r.status in (RenameStatus.RENAMED, RenameStatus.COLLISION)
@@ -43,14 +51,25 @@ def _collect_references(
         and r.final != r.path.name
     ]
     rename_map = {path.name: final for path, final in renamed}
+    if not renamed:
+        return CollectedReferences(references=[], rename_map=rename_map)
+
+    candidates = scan_reference_candidates(search_root, markdown_files, recursive=True)
     all_refs = [
         ref
         for path, _final in renamed
-        for ref in find_references(path, search_root, markdown_files, recursive=True)
+        for ref in select_references(candidates, path)
     ]
     return CollectedReferences(references=all_refs, rename_map=rename_map)
 
 
+def _group_by_image_name(references: list[MarkdownReference]) -> dict[str, list[MarkdownReference]]:
+    groups: dict[str, list[MarkdownReference]] = {}
+    for ref in references:
+        groups.setdefault(ref.image_path.name, []).append(ref)
+    return groups
+
+
 def _update_single_file_references(
     path: Path,
     final_name: str,
@@ -58,8 +77,9 @@ def _update_single_file_references(
     markdown_files: MarkdownFilePort,
     *,
     dry_run: bool,
+    recursive: bool,
 ) -> BatchReferenceResult:
-    refs = find_references(path, search_root, markdown_files, recursive=True)
+    refs = find_references(path, search_root, markdown_files, recursive=recursive)
     early = _count_only_result(refs, dry_run=dry_run)
     if early is not None:
         return early
@@ -78,9 +98,16 @@ def process_single_file_references(
     markdown_files: MarkdownFilePort,
     *,
     dry_run: bool,
+    recursive: bool = True,
 ) -> BatchReferenceResult:
-    """Count or apply markdown reference updates for a single renamed file based on dry_run."""
-    return _update_single_file_references(path, final_name, search_root, markdown_files, dry_run=dry_run)
+    """Count or apply markdown reference updates for a single renamed file based on dry_run.
+
+    ``recursive`` controls whether markdown files below ``search_root``'s
+    subdirectories are searched as well.
+    """
+    return _update_single_file_references(
+        path, final_name, search_root, markdown_files, dry_run=dry_run, recursive=recursive
+    )
 
 
 def process_batch_references(
@@ -96,10 +123,18 @@ def process_batch_references(
     if early is not None:
         return early
 
+    # Match each old name against one representative per distinct image name
+    # rather than against every reference.
+    refs_by_name = _group_by_image_name(collected.references)
     all_updates = []
     all_failures: list[ReferenceUpdateFailure] = []
     for old_name, new_name in collected.rename_map.items():
-        matching_refs = [r for r in collected.references if ref_matches_filename(r, old_name)]
+        matching_refs = [
+            ref
+            for group in refs_by_name.values()
+            if ref_matches_filename(group[0], old_name)
+            for ref in group
+        ]
         result = update_references(matching_refs, old_name, new_name, markdown_files)
         all_updates.extend(result.updates)
         all_failures.extend(result.failures)
@@ -96,6 +96,23 @@ def should_write_updated_content_when_refs_found(tmp_path, mock_markdown_files):
     assert "new.png" in written_content
 
 
+def should_scan_markdown_tree_once_for_multiple_renamed_images(tmp_path, mock_markdown_files):
+    results = [
+        _make_result(tmp_path, "one.png", "first.png", RenameStatus.RENAMED),
+        _make_result(tmp_path, "two.png", "second.png", RenameStatus.RENAMED),
+    ]
+    md_file = tmp_path / "doc.md"
+
+    mock_markdown_files.find_markdown_files.return_value = [md_file]
+    mock_markdown_files.read_markdown_content.return_value = "![](one.png)\n![](two.png)\n"
+
+    result = process_batch_references(results, tmp_path, mock_markdown_files, dry_run=True)
+
+    assert result.total_references == 2
+    mock_markdown_files.find_markdown_files.assert_called_once()
+    mock_markdown_files.read_markdown_content.assert_called_once_with(md_file)
+
+
 def should_skip_error_results(tmp_path, mock_markdown_files):
     results = [
         ProcessingResult(
@@ -315,3 +332,18 @@ def should_propagate_reference_update_failures(tmp_path, mock_markdown_files):
     assert len(result.failures) == 1
     assert result.failures[0].file_path == md_file
     assert "OSError" in result.failures[0].reason
+
+
+def should_apply_every_reference_to_each_renamed_image_across_files(tmp_path, mock_markdown_files):
+    results = [
+        _make_result(tmp_path, "img1.png", "new1.png", RenameStatus.RENAMED),
+        _make_result(tmp_path, "img2.png", "new2.png", RenameStatus.RENAMED),
+    ]
+
+    mock_markdown_files.find_markdown_files.return_value = [tmp_path / "a.md", tmp_path / "b.md"]
+    mock_markdown_files.read_markdown_content.return_value = "![A](img1.png)\n![[img1.png]]\n![B](img2.png)\n"
+
+    result = process_batch_references(results, tmp_path, mock_markdown_files, dry_run=False)
+
+    assert result.files_updated == 2
+    assert result.total_references == 6
@@ -1,22 +1,27 @@
 """Cache operations for storing and retrieving LLM results."""
 
-import json
 import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Callable, Generic, TypeVar, cast
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from constants import FILESYSTEM_IO_ERRORS, RUBRIC_VERSION
 from operations.models import ImageAnalysis
-from utils.fs import sha256_file
+from utils.fs import DEFAULT_FILE_MODE, sha256_file_cached
 
 logger = logging.getLogger(__name__)
 
-_CACHE_LOAD_ERRORS: tuple[type[Exception], ...] = (*FILESYSTEM_IO_ERRORS, json.JSONDecodeError, ValueError)
+# pydantic.ValidationError (malformed JSON or schema mismatch) is a ValueError.
+_CACHE_LOAD_ERRORS: tuple[type[Exception], ...] = (*FILESYSTEM_IO_ERRORS, ValueError)
 
 
 class BaseCacheEntry(BaseModel):
+    model_config = ConfigDict(frozen=True)
 
     image_hash: str = Field(..., description="SHA-256 hash of the image")
     rubric_version: int = Field(..., description="Rubric version")
@@ -30,10 +35,59 @@ class AnalysisCacheEntry(BaseCacheEntry):
     analysis: ImageAnalysis = Field(..., description="Complete analysis result")
 
 
+_KEY_SANITIZER = str.maketrans({"/": "_", ":": "_"})
+_VERSION_SUFFIX = f"__v{RUBRIC_VERSION}"
+
+
 def build_cache_key(image_hash: str, *parts: str) -> str:
     """Cache key with all parts joined by double underscores, rubric version appended."""
-    sanitized = [p.replace("/", "_").replace(":", "_") for p in parts]
-    return "__".join([image_hash, *sanitized, f"v{RUBRIC_VERSION}"])
+    # The image hash is hex, so one translate over the joined key is equivalent to sanitizing each part.
+    return "__".join([image_hash, *parts]).translate(_KEY_SANITIZER) + _VERSION_SUFFIX
+
+
+def cache_entry_path(cache_dir: Path, key: str) -> Path:
+    """Path of the cache file for key, sharded by the first two hex digits of its image hash.
+
+    Sharding keeps each directory to a fraction of the entries, as git does for
+    objects, so lookups stay fast once a cache holds tens of thousands of images.
+    """
+    return cache_dir / key[:2] / f"{key}.json"
+
+
+def _migrate_legacy_entry(cache_dir: Path, key: str, cache_file: Path) -> bool:
+    """Move an entry written by the flat (unsharded) layout into its shard, if there is one."""
+    legacy_file = cache_dir / f"{key}.json"
+    # EAFP: no extra stat per miss, and a concurrent lookup that already moved
+    # the entry is just a miss here rather than a failed load. A missing
+    # cache_dir (nothing cached yet) fails the mkdir and is a miss too.
+    try:
+        cache_file.parent.mkdir(exist_ok=True)
+        os.replace(legacy_file, cache_file)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _write_atomically(cache_file: Path, content: str) -> None:
+    """Write content via a temp file and os.replace, so readers never see a partial entry.
+
+    No fsync: a cache entry lost to a crash only costs a re-analysis, whereas a
+    torn one used to be read back as corrupt JSON.
+    """
+    tmp_path: Path | None = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="w", encoding="utf-8", dir=cache_file.parent, suffix=".tmp", delete=False
+        ) as tmp:
+            tmp_path = Path(tmp.name)
+            tmp.write(content)
+        # NamedTemporaryFile creates files as 0600; give entries the usual umask-based mode.
+        os.chmod(tmp_path, DEFAULT_FILE_MODE)
+        os.replace(tmp_path, cache_file)
+    except FILESYSTEM_IO_ERRORS:
+        if tmp_path is not None and tmp_path.exists():
+            tmp_path.unlink()
+        raise
 
 
 T = TypeVar("T", bound=BaseModel)
@@ -47,12 +101,17 @@ class CacheStore(Generic[T]):
         entry_type: type[BaseCacheEntry],
         payload_field: str,
         key_fields: tuple[str, ...],
-        hash_fn: Callable[[Path], str] = sha256_file,
+        hash_fn: Callable[[Path], str] = sha256_file_cached,
+        memo_size: int = 2048,
     ) -> None:
         self._entry_type = entry_type
         self._payload_field = payload_field
         self._key_fields = key_fields
         self._hash_fn = hash_fn
+        self._memo_size = memo_size
+        # cache file path -> ((mtime_ns, size), parsed entry), least recently used first
+        self._memo: OrderedDict[str, tuple[tuple[int, int], BaseCacheEntry]] = OrderedDict()
+        self._memo_lock = threading.Lock()
 
     def load(self, cache_dir: Path, image_path: Path, **key_values: str) -> T | None:
         """Load a cached payload if it exists and all key values match."""
@@ -60,11 +119,10 @@ class CacheStore(Generic[T]):
         try:
             image_hash = self._hash_fn(image_path)
             key = build_cache_key(image_hash, *(key_values[f] for f in self._key_fields))
-            cache_file = cache_dir / f"{key}.json"
-            if not cache_file.exists():
+            cache_file = cache_entry_path(cache_dir, key)
+            entry = self._read_entry(cache_dir, key, cache_file)
+            if entry is None:
                 return None
-            data = json.loads(cache_file.read_text(encoding="utf-8"))
-            entry = self._entry_type.model_validate(data)
             if entry.image_hash != image_hash or entry.rubric_version != RUBRIC_VERSION:
                 return None
             if not all(getattr(entry, f) == key_values[f] for f in self._key_fields):
@@ -77,23 +135,57 @@ class CacheStore(Generic[T]):
             )
             return None
 
+    def _read_entry(self, cache_dir: Path, key: str, cache_file: Path) -> BaseCacheEntry | None:
+        """Read and validate the entry in cache_file, reusing the parsed entry while the file is unchanged.
+
+        Repeated lookups in one process (e.g. the GUI preloading the cache and
+        then analyzing the same folder) cost an open and fstat instead of a
+        read and parse.
+        """
+        try:
+            f = cache_file.open("rb")
+        except FileNotFoundError:
+            # A miss is the common case on first runs; opening directly (EAFP)
+            # avoids a separate exists() stat on every lookup.
+            if not _migrate_legacy_entry(cache_dir, key, cache_file):
+                return None
+            f = cache_file.open("rb")
+        with f:
+            # One open serves both the memo check (fstat) and, on a memo miss, the read.
+            st = os.fstat(f.fileno())
+            identity = (st.st_mtime_ns, st.st_size)
+            memo_key = os.fspath(cache_file)
+            with self._memo_lock:
+                memoized = self._memo.get(memo_key)
+                if memoized is not None and memoized[0] == identity:
+                    self._memo.move_to_end(memo_key)
+                    return memoized[1]
+            raw = f.read()
+        # Parse and validate in one pass in pydantic-core, without building
+        # an intermediate dict; cache files are still untrusted input.
+        entry = self._entry_type.model_validate_json(raw)
+        with self._memo_lock:
+            self._memo[memo_key] = (identity, entry)
+            if len(self._memo) > self._memo_size:
+                self._memo.popitem(last=False)
+        return entry
+
     def save(self, cache_dir: Path, image_path: Path, payload: T, **key_values: str) -> None:
         """Persist payload to a JSON cache file keyed by image hash and key_values."""
         try:
             image_hash = self._hash_fn(image_path)
             key = build_cache_key(image_hash, *(key_values[f] for f in self._key_fields))
-            cache_file = cache_dir / f"{key}.json"
+            cache_file = cache_entry_path(cache_dir, key)
             entry = self._entry_type(
                 image_hash=image_hash,
                 rubric_version=RUBRIC_VERSION,
                 **{self._payload_field: payload},
                 **key_values,
             )
-            cache_dir.mkdir(parents=True, exist_ok=True)
-            cache_file.write_text(
-                entry.model_dump_json(indent=2) + "\n",
-                encoding="utf-8",
-            )
+            with self._memo_lock:
+                self._memo.pop(os.fspath(cache_file), None)
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            _write_atomically(cache_file, entry.model_dump_json(indent=2) + "\n")
         except FILESYSTEM_IO_ERRORS as e:
             logger.warning(
                 "Cache save failed (image=%s): %s: %s",
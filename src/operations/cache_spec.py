@@ -1,17 +1,22 @@
 import json
 import logging
+import stat
 
 import pytest
+from pydantic import ValidationError
 
 from conftest import make_analysis
 from constants import RUBRIC_VERSION
 from operations.cache import (
     AnalysisCacheEntry,
     CacheStore,
+    _migrate_legacy_entry,
     build_cache_key,
+    cache_entry_path,
     load_analysis_from_cache,
     save_analysis_to_cache,
 )
+from utils.fs import DEFAULT_FILE_MODE
 
 _fake_hasher = lambda _: "abc123"  # noqa: E731
 
@@ -65,6 +70,16 @@ def should_return_none_when_cache_file_missing(store, cache_dir, image_path):
     assert result is None
 
 
+def should_not_log_warning_when_cache_file_missing(store, cache_dir, image_path, caplog):
+    with caplog.at_level(logging.WARNING):
+        store.load(
+            cache_dir, image_path,
+            filename="test-image.png", provider="ollama", model="gemma3:27b",
+        )
+
+    assert caplog.records == []
+
+
 def should_return_payload_after_save(store, cache_dir, image_path):
     analysis = make_analysis(stem="test-name")
 
@@ -125,7 +140,7 @@ def should_return_none_when_rubric_version_tampered(store, cache_dir, image_path
     )
 
     key = build_cache_key("abc123", "test-image.png", "ollama", "gemma3:27b")
-    cache_file = cache_dir / f"{key}.json"
+    cache_file = cache_entry_path(cache_dir, key)
     data = json.loads(cache_file.read_text(encoding="utf-8"))
     data["rubric_version"] = RUBRIC_VERSION + 1
     cache_file.write_text(json.dumps(data), encoding="utf-8")
@@ -139,9 +154,9 @@ def should_return_none_when_rubric_version_tampered(store, cache_dir, image_path
 
 
 def should_return_none_when_cache_file_corrupted(store, cache_dir, image_path):
-    cache_dir.mkdir(parents=True)
     key = build_cache_key("abc123", "test-image.png", "ollama", "gemma3:27b")
-    (cache_dir / f"{key}.json").write_text("invalid json {{{", encoding="utf-8")
+    cache_entry_path(cache_dir, key).parent.mkdir(parents=True)
+    cache_entry_path(cache_dir, key).write_text("invalid json {{{", encoding="utf-8")
 
     result = store.load(
         cache_dir, image_path,
@@ -172,7 +187,7 @@ def should_serialize_as_valid_json(store, cache_dir, image_path):
     )
 
     key = build_cache_key("abc123", "test-image.png", "ollama", "gemma3:27b")
-    data = json.loads((cache_dir / f"{key}.json").read_text(encoding="utf-8"))
+    data = json.loads(cache_entry_path(cache_dir, key).read_text(encoding="utf-8"))
 
     assert data["image_hash"] == "abc123"
     assert data["filename"] == "test-image.png"
@@ -182,6 +197,131 @@ def should_serialize_as_valid_json(store, cache_dir, image_path):
     assert data["analysis"]["proposed_name"]["stem"] == "test-name"
 
 
+def should_shard_cache_files_by_image_hash_prefix(store, cache_dir, image_path):
+    store.save(
+        cache_dir, image_path, make_analysis(stem="test-name"),
+        filename="test-image.png", provider="ollama", model="gemma3:27b",
+    )
+
+    key = build_cache_key("abc123", "test-image.png", "ollama", "gemma3:27b")
+    assert cache_entry_path(cache_dir, key) == cache_dir / "ab" / f"{key}.json"
+    assert cache_entry_path(cache_dir, key).is_file()
+
+
+def should_load_and_move_entry_from_flat_layout_into_shard(store, cache_dir, image_path):
+    store.save(
+        cache_dir, image_path, make_analysis(stem="legacy-name"),
+        filename="test-image.png", provider="ollama", model="gemma3:27b",
+    )
+    key = build_cache_key("abc123", "test-image.png", "ollama", "gemma3:27b")
+    legacy_file = cache_dir / f"{key}.json"
+    cache_entry_path(cache_dir, key).rename(legacy_file)
+
+    loaded = store.load(
+        cache_dir, image_path,
+        filename="test-image.png", provider="ollama", model="gemma3:27b",
+    )
+
+    assert loaded is not None
+    assert loaded.proposed_name.stem == "legacy-name"
+    assert not legacy_file.exists()
+    assert cache_entry_path(cache_dir, key).is_file()
+
+
+def should_return_false_without_logging_when_legacy_entry_is_missing(cache_dir, caplog):
+    key = build_cache_key("abc123", "test-image.png", "ollama", "gemma3:27b")
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    with caplog.at_level(logging.DEBUG, logger="operations.cache"):
+        moved = _migrate_legacy_entry(cache_dir, key, cache_entry_path(cache_dir, key))
+
+    assert moved is False
+    assert caplog.records == []
+
+
+def should_reuse_parsed_entry_while_cache_file_unchanged(store, cache_dir, image_path, mocker):
+    store.save(
+        cache_dir, image_path, make_analysis(stem="test-name"),
+        filename="test-image.png", provider="ollama", model="gemma3:27b",
+    )
+    first = store.load(cache_dir, image_path, filename="test-image.png", provider="ollama", model="gemma3:27b")
+    parse = mocker.spy(AnalysisCacheEntry, "model_validate_json")
+
+    second = store.load(cache_dir, image_path, filename="test-image.png", provider="ollama", model="gemma3:27b")
+
+    assert second == first
+    parse.assert_not_called()
+
+
+def should_not_allow_mutating_an_entry_shared_by_the_memo(store, cache_dir, image_path):
+    store.save(
+        cache_dir, image_path, make_analysis(stem="test-name"),
+        filename="test-image.png", provider="ollama", model="gemma3:27b",
+    )
+    loaded = store.load(cache_dir, image_path, filename="test-image.png", provider="ollama", model="gemma3:27b")
+
+    with pytest.raises(ValidationError):
+        loaded.proposed_name.stem = "changed"
+
+
+def should_reparse_cache_file_rewritten_by_another_process(store, cache_dir, image_path):
+    store.save(
+        cache_dir, image_path, make_analysis(stem="old-name"),
+        filename="test-image.png", provider="ollama", model="gemma3:27b",
+    )
+    store.load(cache_dir, image_path, filename="test-image.png", provider="ollama", model="gemma3:27b")
+    key = build_cache_key("abc123", "test-image.png", "ollama", "gemma3:27b")
+    cache_file = cache_entry_path(cache_dir, key)
+    cache_file.write_text(cache_file.read_text(encoding="utf-8").replace("old-name", "newer-name"), encoding="utf-8")
+
+    loaded = store.load(cache_dir, image_path, filename="test-image.png", provider="ollama", model="gemma3:27b")
+
+    assert loaded is not None
+    assert loaded.proposed_name.stem == "newer-name"
+
+
+def should_miss_after_cache_file_deleted(store, cache_dir, image_path):
+    store.save(
+        cache_dir, image_path, make_analysis(stem="test-name"),
+        filename="test-image.png", provider="ollama", model="gemma3:27b",
+    )
+    store.load(cache_dir, image_path, filename="test-image.png", provider="ollama", model="gemma3:27b")
+    key = build_cache_key("abc123", "test-image.png", "ollama", "gemma3:27b")
+    cache_entry_path(cache_dir, key).unlink()
+
+    result = store.load(cache_dir, image_path, filename="test-image.png", provider="ollama", model="gemma3:27b")
+
+    assert result is None
+
+
+def should_write_cache_files_with_umask_default_mode(store, cache_dir, image_path):
+    store.save(
+        cache_dir, image_path, make_analysis(stem="test-name"),
+        filename="test-image.png", provider="ollama", model="gemma3:27b",
+    )
+    cache_file = cache_entry_path(cache_dir, build_cache_key("abc123", "test-image.png", "ollama", "gemma3:27b"))
+
+    assert stat.S_IMODE(cache_file.stat().st_mode) == DEFAULT_FILE_MODE
+
+
+def should_keep_previous_entry_and_leave_no_tmp_when_replace_fails(store, cache_dir, image_path, mocker):
+    store.save(
+        cache_dir, image_path, make_analysis(stem="first-name"),
+        filename="test-image.png", provider="ollama", model="gemma3:27b",
+    )
+    mocker.patch("operations.cache.os.replace", side_effect=OSError("disk full"))
+
+    store.save(
+        cache_dir, image_path, make_analysis(stem="second-name"),
+        filename="test-image.png", provider="ollama", model="gemma3:27b",
+    )
+
+    loaded = store.load(cache_dir, image_path, filename="test-image.png", provider="ollama", model="gemma3:27b")
+    assert loaded is not None
+    assert loaded.proposed_name.stem == "first-name"
+    assert list(cache_dir.rglob("*.tmp")) == []
+
+
 def should_overwrite_existing_cache_entry(store, cache_dir, image_path):
     first = make_analysis(stem="first-name")
     second = make_analysis(stem="second-name")
@@ -204,9 +344,9 @@ def should_overwrite_existing_cache_entry(store, cache_dir, image_path):
 
 
 def should_log_warning_when_cache_file_is_corrupted(store, cache_dir, image_path, caplog):
-    cache_dir.mkdir(parents=True)
     key = build_cache_key("abc123", "test-image.png", "ollama", "gemma3:27b")
-    (cache_dir / f"{key}.json").write_text("invalid json {{{", encoding="utf-8")
+    cache_entry_path(cache_dir, key).parent.mkdir(parents=True)
+    cache_entry_path(cache_dir, key).write_text("invalid json {{{", encoding="utf-8")
 
     with caplog.at_level(logging.WARNING, logger="operations.cache"):
         result = store.load(
@@ -215,14 +355,14 @@ def should_log_warning_when_cache_file_is_corrupted(store, cache_dir, image_path
         )
 
     assert result is None
-    assert any("JSONDecodeError" in r.getMessage() for r in caplog.records)
+    assert any("json_invalid" in r.getMessage() for r in caplog.records)
     assert any("test-image.png" in r.getMessage() for r in caplog.records)
 
 
 def should_log_warning_when_cache_file_read_raises_oserror(store, cache_dir, image_path, caplog):
-    cache_dir.mkdir(parents=True)
     key = build_cache_key("abc123", "test-image.png", "ollama", "gemma3:27b")
-    cache_file = cache_dir / f"{key}.json"
+    cache_file = cache_entry_path(cache_dir, key)
+    cache_file.parent.mkdir(parents=True)
     cache_file.write_text("{}", encoding="utf-8")
     cache_file.chmod(0o000)
 
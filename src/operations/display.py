@@ -1,28 +1,122 @@
 """Display formatting utilities: accept a Console and domain models, produce Rich output."""
 
+import logging
+import sys
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
 from rich.console import Console
-from rich.table import Table
+from rich.text import Text
 
 from operations.models import BatchReferenceResult, ProcessingResult
 from operations.process_folder import compute_statistics
 from operations.rename_status_display import RENAME_STATUS_PRESENTATION
 
+if TYPE_CHECKING:
+    from rich.table import Table
+
+# Rows kept in the live view while a folder is still being processed.
+_LIVE_TAIL_ROWS = 10
+
+
+def _build_results_table(dry_run: bool) -> "Table":
+    from rich.table import Table
 
-def display_results_table(console: Console, results: list[ProcessingResult], dry_run: bool) -> None:
-    """Render a Rich table of processing results to the console."""
     table = Table(title=f"image-namer: folder ({'dry-run' if dry_run else 'apply'})")
     table.add_column("Source", style="dim")
     table.add_column("Proposed", style="bold")
     table.add_column("Final", style="green")
     table.add_column("Status", style="cyan")
+    return table
+
+
+def _add_result_row(table: "Table", result: ProcessingResult) -> None:
+    status_display = RENAME_STATUS_PRESENTATION[result.status].table_label
+    # Filenames are plain text: wrapping them skips markup parsing per row and keeps
+    # names like "[draft] shot.png" from being read as style tags.
+    table.add_row(Text(result.source), Text(result.proposed), Text(result.final), status_display)
+
+
+def print_error_line(console: Console, message: str) -> None:
+    """Print one per-item error line in red, without markup, emoji or highlighting.
+
+    Used on paths that print once per failed file, where ``message`` embeds
+    filenames or OS error text that must be shown verbatim.
+    """
+    console.print(message, style="red", markup=False, emoji=False, highlight=False)
 
-    for result in results:
-        status_display = RENAME_STATUS_PRESENTATION[result.status].table_label
-        table.add_row(result.source, result.proposed, result.final, status_display)
 
+def display_results_table(console: Console, results: list[ProcessingResult], dry_run: bool) -> None:
+    """Render a Rich table of processing results to the console."""
+    table = _build_results_table(dry_run)
+    for result in results:
+        _add_result_row(table, result)
     console.print(table)
 
 
+def stream_results_table(
+    console: Console,
+    results: Iterable[ProcessingResult],
+    dry_run: bool,
+) -> list[ProcessingResult]:
+    """Show results live as they arrive, then print the full results table once.
+
+    Consumes ``results`` (typically a generator still producing results) and
+    returns them as a list for the rename and reference-update stages. The live
+    view holds only the most recent ``_LIVE_TAIL_ROWS`` rows, so each refresh
+    costs the same however large the folder; it is cleared when done. Log
+    records emitted meanwhile (e.g. from analysis worker threads) are routed
+    through ``console`` so they print above the live view instead of through it.
+    """
+    from rich.live import Live
+
+    collected: list[ProcessingResult] = []
+    with _logging_through(console), Live(
+        _build_results_table(dry_run), console=console, refresh_per_second=4, transient=True,
+    ) as live:
+        for result in results:
+            collected.append(result)
+            live.update(_build_tail_table(collected, dry_run))
+    display_results_table(console, collected, dry_run)
+    return collected
+
+
+def _build_tail_table(results: list[ProcessingResult], dry_run: bool) -> "Table":
+    table = _build_results_table(dry_run)
+    table.caption = f"{len(results)} processed"
+    for result in results[-_LIVE_TAIL_ROWS:]:
+        _add_result_row(table, result)
+    return table
+
+
+@contextmanager
+def _logging_through(console: Console) -> Iterator[None]:
+    """Temporarily send root-logger output to ``console`` instead of the terminal streams."""
+    from rich.logging import RichHandler
+
+    root = logging.getLogger()
+    replaced = [
+        h for h in root.handlers
+        if type(h) is logging.StreamHandler and h.stream in (sys.stderr, sys.stdout)
+    ]
+    if root.handlers and not replaced:
+        yield
+        return
+    handler = RichHandler(console=console, show_time=False, show_path=False, markup=False)
+    if replaced:
+        handler.setLevel(min(h.level for h in replaced))
+    for h in replaced:
+        root.removeHandler(h)
+    root.addHandler(handler)
+    try:
+        yield
+    finally:
+        root.removeHandler(handler)
+        for h in replaced:
+            root.addHandler(h)
+
+
 def print_statistics(console: Console, results: list[ProcessingResult]) -> None:
     """Print a one-line summary of rename statistics to the console."""
     stats = compute_statistics(results)
@@ -50,4 +144,4 @@ def print_reference_result(console: Console, ref_result: BatchReferenceResult, d
     if ref_result.failures:
         console.print(f"[red]⚠ {len(ref_result.failures)} reference(s) could not be updated:[/red]")
         for failure in ref_result.failures:
-            console.print(f"[red]  {failure.file_path}:{failure.line_number} — {failure.reason}[/red]")
+            print_error_line(console, f"  {failure.file_path}:{failure.line_number} — {failure.reason}")
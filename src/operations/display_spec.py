@@ -1,10 +1,18 @@
 """Tests for display formatting utilities."""
 import io
+import logging
+import sys
 
 from rich.console import Console
 from rich.table import Table
 
-from operations.display import display_results_table, print_reference_result, print_statistics
+from operations.display import (
+    display_results_table,
+    print_error_line,
+    print_reference_result,
+    print_statistics,
+    stream_results_table,
+)
 from operations.models import BatchReferenceResult, ProcessingResult, ReferenceUpdateFailure, RenameStatus
 from pathlib import Path
 
@@ -94,6 +102,70 @@ def should_display_error_status(mocker):
     assert table.row_count == 1
 
 
+def should_stream_rows_and_return_all_results():
+    output = io.StringIO()
+    console = Console(file=output, highlight=False, width=120)
+    results = [
+        _make_result(RenameStatus.RENAMED, "a.png", "b.png", "b.png"),
+        _make_result(RenameStatus.UNCHANGED, "c.png", "c.png", "c.png"),
+    ]
+
+    collected = stream_results_table(console, iter(results), dry_run=True)
+
+    assert collected == results
+    printed = output.getvalue()
+    assert "dry-run" in printed
+    assert "a.png" in printed
+    assert "c.png" in printed
+
+
+def should_print_every_row_in_final_table_after_streaming():
+    output = io.StringIO()
+    console = Console(file=output, highlight=False, width=120)
+    results = [_make_result(RenameStatus.RENAMED, f"img-{i:02d}.png", "b.png", "b.png") for i in range(25)]
+
+    stream_results_table(console, iter(results), dry_run=True)
+
+    printed = output.getvalue()
+    assert all(f"img-{i:02d}.png" in printed for i in range(25))
+
+
+def should_route_warnings_through_console_while_streaming(monkeypatch):
+    output = io.StringIO()
+    console = Console(file=output, highlight=False, width=120)
+    root = logging.getLogger()
+    stderr_handler = logging.StreamHandler(sys.stderr)
+    monkeypatch.setattr(root, "handlers", [stderr_handler])
+
+    def results():
+        logging.getLogger("operations.cache").warning("Cache save failed (image=a.png)")
+        yield _make_result(RenameStatus.RENAMED, "a.png", "b.png", "b.png")
+
+    stream_results_table(console, results(), dry_run=True)
+
+    assert "Cache save failed (image=a.png)" in output.getvalue()
+    assert root.handlers == [stderr_handler]
+
+
+def should_show_bracketed_filenames_verbatim_in_table():
+    output = io.StringIO()
+    console = Console(file=output, highlight=False, width=120)
+    results = [_make_result(RenameStatus.RENAMED, "[draft] a.png", "b.png", "b.png")]
+
+    display_results_table(console, results, dry_run=True)
+
+    assert "[draft] a.png" in output.getvalue()
+
+
+def should_print_error_line_verbatim():
+    output = io.StringIO()
+    console = Console(file=output)
+
+    print_error_line(console, "✗ Failed to rename [draft] :smile: shot.png: [Errno 13] Permission denied")
+
+    assert output.getvalue() == "✗ Failed to rename [draft] :smile: shot.png: [Errno 13] Permission denied\n"
+
+
 def should_print_statistics_with_correct_counts(mocker):
     console = mocker.Mock(spec=Console)
     results = [
@@ -0,0 +1,72 @@
+"""Downscale large images before they are uploaded to a vision model."""
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from constants import FILESYSTEM_IO_ERRORS, MAX_UPLOAD_EDGE
+from utils.fs import DEFAULT_FILE_MODE, sha256_file_cached
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+JPEG_QUALITY = 85
+
+# Pillow raises OSError for unreadable or truncated files and ValueError for unsupported modes.
+_WRITE_ERRORS: tuple[type[Exception], ...] = (*FILESYSTEM_IO_ERRORS, ValueError)
+
+
+def downscale_for_upload(path: Path, cache_dir: Path, max_edge: int = MAX_UPLOAD_EDGE) -> Path:
+    """Return a path to send to the vision model in place of ``path``.
+
+    Images whose longest edge exceeds ``max_edge`` are shrunk with Lanczos
+    resampling, re-encoded as JPEG, and written to ``cache_dir`` keyed by
+    content hash and edge size, so later runs reuse the resized copy. Images
+    already small enough are returned unchanged, as is ``path`` itself when
+    Pillow is not installed or the image cannot be read or resized.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return path
+
+    errors: tuple[type[Exception], ...] = (*_WRITE_ERRORS, Image.DecompressionBombError)
+    try:
+        target = cache_dir / f"{sha256_file_cached(path)}__{max_edge}.jpg"
+        if target.exists():
+            return target
+        with Image.open(path) as im:
+            if max(im.size) <= max_edge:
+                return path
+            _write_downscaled(im, target, max_edge)
+        return target
+    except errors as e:
+        logger.warning("Could not downscale %s, sending original: %s", path, e)
+        return path
+
+
+def _write_downscaled(im: "Image.Image", target: Path, max_edge: int) -> None:
+    from PIL import Image, ImageOps
+
+    resized = ImageOps.exif_transpose(im)
+    resized.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+    if resized.mode != "RGB":
+        resized = resized.convert("RGB")
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path: Path | None = None
+    try:
+        with tempfile.NamedTemporaryFile(dir=target.parent, suffix=".tmp", delete=False) as tmp:
+            tmp_path = Path(tmp.name)
+            resized.save(tmp, format="JPEG", quality=JPEG_QUALITY)
+        # NamedTemporaryFile creates files as 0600; give copies the usual umask-based mode.
+        os.chmod(tmp_path, DEFAULT_FILE_MODE)
+        os.replace(tmp_path, target)
+    except _WRITE_ERRORS:
+        if tmp_path is not None and tmp_path.exists():
+            tmp_path.unlink()
+        raise
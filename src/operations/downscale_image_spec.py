@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import pytest
+
+from operations.downscale_image import downscale_for_upload
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _write_image(path: Path, size: tuple[int, int], mode: str = "RGB") -> Path:
+    Image.new(mode, size).save(path)
+    return path
+
+
+def should_return_original_when_within_max_edge(tmp_path: Path):
+    img = _write_image(tmp_path / "small.png", (640, 480))
+
+    result = downscale_for_upload(img, tmp_path / "resized", max_edge=1024)
+
+    assert result == img
+    assert not (tmp_path / "resized").exists()
+
+
+def should_shrink_longest_edge_to_max_edge(tmp_path: Path):
+    img = _write_image(tmp_path / "large.png", (2048, 1024))
+
+    result = downscale_for_upload(img, tmp_path / "resized", max_edge=1024)
+
+    assert result.parent == tmp_path / "resized"
+    with Image.open(result) as im:
+        assert im.format == "JPEG"
+        assert im.size == (1024, 512)
+
+
+def should_convert_transparent_images_to_rgb_jpeg(tmp_path: Path):
+    img = _write_image(tmp_path / "large.png", (1200, 1200), mode="RGBA")
+
+    result = downscale_for_upload(img, tmp_path / "resized", max_edge=600)
+
+    with Image.open(result) as im:
+        assert im.mode == "RGB"
+
+
+def should_reuse_resized_copy_on_later_calls(tmp_path: Path, mocker):
+    img = _write_image(tmp_path / "large.png", (2048, 1024))
+    first = downscale_for_upload(img, tmp_path / "resized", max_edge=1024)
+    spy = mocker.spy(Image, "open")
+
+    second = downscale_for_upload(img, tmp_path / "resized", max_edge=1024)
+
+    assert second == first
+    spy.assert_not_called()
+
+
+def should_return_original_when_image_unreadable(tmp_path: Path):
+    img = tmp_path / "broken.png"
+    img.write_bytes(b"not an image")
+
+    result = downscale_for_upload(img, tmp_path / "resized", max_edge=1024)
+
+    assert result == img
@@ -1,20 +1,25 @@
 """Find markdown references to images."""
 import logging
-import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from constants import FILESYSTEM_IO_ERRORS
-from operations.models import MarkdownReference
+from operations.models import MarkdownReference, ReferenceCandidate
 from operations.ports import MarkdownFilePort
 from operations.text_utils import (
     names_match,
     ref_path_matches_image,
-    REFERENCE_PATTERNS,
+    resolve_image_path,
+    REFERENCE_RES,
     WIKI_REF_TYPES,
 )
 
 logger = logging.getLogger(__name__)
 
+# Below this many files a thread pool costs more to start than it saves.
+_SCAN_POOL_MIN_FILES = 4
+_SCAN_MAX_WORKERS = 8
+
 
 def find_references(
     image_path: Path,
@@ -32,89 +37,97 @@ def find_references(
     - Wiki link: [[image.png]], [[image.png|alias]]
     - Wiki embed: ![[image.png]], ![[image.png|alias]]
     """
-    image_name = image_path.name
-    patterns = _get_reference_patterns()
+    candidates = scan_reference_candidates(refs_root, markdown_files, recursive=recursive)
+    return select_references(candidates, image_path)
 
-    return [
-        ref
-        for md_file in markdown_files.find_markdown_files(refs_root, recursive=recursive)
-        for ref in _references_in_file(md_file, image_path, image_name, patterns, markdown_files)
-    ]
+
+def scan_reference_candidates(
+    refs_root: Path,
+    markdown_files: MarkdownFilePort,
+    *,
+    recursive: bool = True
+) -> list[ReferenceCandidate]:
+    """Read every markdown file under refs_root once and return all links and embeds found.
+
+    Pair with select_references to look up many images against a single scan
+    instead of re-reading the markdown tree per image. Files are read on a
+    bounded thread pool so their I/O overlaps (which matters most on network or
+    cloud-synced vaults); a handful of files, as in a single-directory scan, is
+    read inline. Candidates are returned in file order.
+    """
+    md_files = markdown_files.find_markdown_files(refs_root, recursive=recursive)
+    if len(md_files) < _SCAN_POOL_MIN_FILES:
+        return [candidate for md_file in md_files for candidate in _candidates_in_file(md_file, markdown_files)]
+    with ThreadPoolExecutor(max_workers=_SCAN_MAX_WORKERS) as executor:
+        per_file = executor.map(lambda md_file: _candidates_in_file(md_file, markdown_files), md_files)
+        return [candidate for candidates in per_file for candidate in candidates]
+
+
+def select_references(candidates: list[ReferenceCandidate], image_path: Path) -> list[MarkdownReference]:
+    """Return the references among candidates that point at image_path."""
+    image_name = image_path.name
+    resolved_image = resolve_image_path(image_path)
+    matches = (_match_to_reference(candidate, image_path, image_name, resolved_image) for candidate in candidates)
+    return [ref for ref in matches if ref is not None]
 
 
-def _references_in_file(
+def _candidates_in_file(
     md_file: Path,
-    image_path: Path,
-    image_name: str,
-    patterns: dict[str, re.Pattern[str]],
     markdown_files: MarkdownFilePort,
-) -> list[MarkdownReference]:
+) -> list[ReferenceCandidate]:
     try:
         content = markdown_files.read_markdown_content(md_file)
     except FILESYSTEM_IO_ERRORS as exc:
         logger.warning("Skipping unreadable markdown file %s: %s", md_file, exc)
         return []
+    # Every reference syntax contains '['; most lines (and many files) have none,
+    # and a substring check is far cheaper than running four regexes over them.
+    if "[" not in content:
+        return []
     return [
-        ref
+        candidate
         for line_num, line in enumerate(content.splitlines(keepends=True), start=1)
-        for ref in _find_references_in_line(line, line_num, md_file, image_path, image_name, patterns)
+        if "[" in line
+        for candidate in _candidates_in_line(line, line_num, md_file)
     ]
 
 
-def _get_reference_patterns() -> dict[str, re.Pattern[str]]:
-    return {
-        ref_type: re.compile(
-            (r'(?<!!)' if not pattern.startswith('!') else '') + pattern
+def _candidates_in_line(
+    line: str,
+    line_num: int,
+    md_file: Path,
+) -> list[ReferenceCandidate]:
+    return [
+        ReferenceCandidate(
+            file_path=md_file,
+            line_number=line_num,
+            original_text=match.group(0),
+            target=match.group(1) if ref_type in WIKI_REF_TYPES else match.group(2),
+            ref_type=ref_type,
         )
-        for ref_type, pattern in REFERENCE_PATTERNS.items()
-    }
+        for ref_type, pattern_re in REFERENCE_RES.items()
+        for match in pattern_re.finditer(line)
+    ]
 
 
 def _match_to_reference(
-    ref_type: str,
-    match: re.Match[str],
-    md_file: Path,
-    line_num: int,
+    candidate: ReferenceCandidate,
     image_path: Path,
     image_name: str,
+    resolved_image: Path | None,
 ) -> MarkdownReference | None:
-    if ref_type in WIKI_REF_TYPES:
-        ref_name = match.group(1)
-        if names_match(ref_name, image_name):
-            return MarkdownReference(
-                file_path=md_file,
-                line_number=line_num,
-                original_text=match.group(0),
-                image_path=Path(ref_name),
-                ref_type=ref_type,
-            )
-    else:
-        ref_path = Path(match.group(2))
-        if ref_path_matches_image(ref_path, image_path, image_name):
-            return MarkdownReference(
-                file_path=md_file,
-                line_number=line_num,
-                original_text=match.group(0),
-                image_path=ref_path,
-                ref_type=ref_type,
-            )
-    return None
-
-
-def _find_references_in_line(
-    line: str,
-    line_num: int,
-    md_file: Path,
-    image_path: Path,
-    image_name: str,
-    patterns: dict[str, re.Pattern[str]]
-) -> list[MarkdownReference]:
-    candidates = (
-        _match_to_reference(ref_type, match, md_file, line_num, image_path, image_name)
-        for ref_type, pattern_re in patterns.items()
-        for match in pattern_re.finditer(line)
+    if candidate.ref_type in WIKI_REF_TYPES:
+        if not names_match(candidate.target, image_name):
+            return None
+    elif not ref_path_matches_image(Path(candidate.target), image_path, image_name, resolved_image):
+        return None
+    return MarkdownReference(
+        file_path=candidate.file_path,
+        line_number=candidate.line_number,
+        original_text=candidate.original_text,
+        image_path=Path(candidate.target),
+        ref_type=candidate.ref_type,
     )
-    return [ref for ref in candidates if ref is not None]
 
 
 def ref_matches_filename(ref: MarkdownReference, filename: str) -> bool:
@@ -1,7 +1,13 @@
 """Tests for find_references operation."""
+import threading
 from pathlib import Path
 
-from operations.find_references import find_references, ref_matches_filename
+from operations.find_references import (
+    find_references,
+    ref_matches_filename,
+    scan_reference_candidates,
+    select_references,
+)
 from operations.models import MarkdownReference
 
 
@@ -209,6 +215,43 @@ def should_return_empty_list_when_no_references_found(tmp_path, mock_markdown_fi
     assert len(refs) == 0
 
 
+def should_return_no_candidates_for_file_without_brackets(tmp_path, mock_markdown_files):
+    mock_markdown_files.find_markdown_files.return_value = [tmp_path / "prose.md"]
+    mock_markdown_files.read_markdown_content.return_value = "# Notes\nJust prose (with parentheses).\n"
+
+    candidates = scan_reference_candidates(tmp_path, mock_markdown_files, recursive=False)
+
+    assert candidates == []
+
+
+def should_read_markdown_files_concurrently_and_keep_file_order(tmp_path, mock_markdown_files):
+    md_files = [tmp_path / f"{name}.md" for name in "abcd"]
+    mock_markdown_files.find_markdown_files.return_value = md_files
+    barrier = threading.Barrier(len(md_files), timeout=5)
+
+    def read(md_file):
+        barrier.wait()
+        return f"![x]({md_file.stem}.png)\n"
+
+    mock_markdown_files.read_markdown_content.side_effect = read
+
+    candidates = scan_reference_candidates(tmp_path, mock_markdown_files, recursive=False)
+
+    assert [c.file_path for c in candidates] == md_files
+
+
+def should_read_a_few_markdown_files_without_a_thread_pool(tmp_path, mock_markdown_files, mocker):
+    pool = mocker.patch("operations.find_references.ThreadPoolExecutor")
+    md_files = [tmp_path / "a.md", tmp_path / "b.md"]
+    mock_markdown_files.find_markdown_files.return_value = md_files
+    mock_markdown_files.read_markdown_content.side_effect = lambda md_file: f"![x]({md_file.stem}.png)\n"
+
+    candidates = scan_reference_candidates(tmp_path, mock_markdown_files, recursive=False)
+
+    assert [c.file_path for c in candidates] == md_files
+    pool.assert_not_called()
+
+
 def should_match_stem_only_wiki_links(tmp_path, mock_markdown_files):
     image_path = tmp_path / "document.png"
     md_file = tmp_path / "wiki.md"
@@ -487,3 +530,16 @@ def should_scan_remaining_files_when_one_is_unreadable(tmp_path, mock_markdown_f
 
     assert len(refs) == 1
     assert refs[0].file_path == good_md
+
+
+def should_select_references_per_image_from_a_single_scan(tmp_path, mock_markdown_files):
+    md_file = tmp_path / "note.md"
+    mock_markdown_files.find_markdown_files.return_value = [md_file]
+    mock_markdown_files.read_markdown_content.return_value = "![](a.png) [[b.png]]\n"
+    candidates = scan_reference_candidates(tmp_path, mock_markdown_files, recursive=False)
+
+    refs_a = select_references(candidates, tmp_path / "a.png")
+    refs_b = select_references(candidates, tmp_path / "b.png")
+
+    assert [r.original_text for r in refs_a] == ["![](a.png)"]
+    assert [r.original_text for r in refs_b] == ["[[b.png]]"]
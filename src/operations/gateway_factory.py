@@ -3,20 +3,41 @@
 Shared between CLI and GUI to eliminate duplicated provider-setup logic.
 """
 
+import functools
 import os
-
-from mojentic.llm.gateways import OllamaGateway, OpenAIGateway
+from typing import TYPE_CHECKING
 
 from constants import SUPPORTED_PROVIDERS
 
+if TYPE_CHECKING:
+    from mojentic.llm.gateways import OllamaGateway, OpenAIGateway
+
 
 class MissingApiKeyError(Exception):
     """Raised when a required API key is not set in the environment."""
 
 
-def create_gateway(provider: str) -> OllamaGateway | OpenAIGateway:
+def create_gateway(provider: str) -> "OllamaGateway | OpenAIGateway":
     """Create the appropriate LLM gateway for the given provider.
 
+    Gateways are memoized per provider and API key, so repeated calls (e.g. each
+    GUI analysis run or model-list refresh) reuse the same client; rotating
+    ``OPENAI_API_KEY`` yields a fresh gateway.
+
+    Raises:
+        MissingApiKeyError: If the provider requires an API key not found in
+            the environment.
+        ValueError: If provider is not recognised.
+    """
+    return _cached_gateway(provider, require_api_key(provider))
+
+
+def require_api_key(provider: str) -> str | None:
+    """Return the API key the provider needs, or None if it needs none.
+
+    Cheap and import-free, so callers can reject a misconfigured provider
+    before scanning files or building the pipeline.
+
     Raises:
         MissingApiKeyError: If the provider requires an API key not found in
             the environment.
@@ -25,8 +46,18 @@ def create_gateway(provider: str) -> OllamaGateway | OpenAIGateway:
     if provider not in SUPPORTED_PROVIDERS:
         raise ValueError(f"Unknown provider: {provider!r}")
     if provider == "ollama":
-        return OllamaGateway()
+        return None
     api_key = os.environ.get("OPENAI_API_KEY")
     if not api_key:
         raise MissingApiKeyError("OPENAI_API_KEY environment variable not set")
+    return api_key
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_gateway(provider: str, api_key: str | None) -> "OllamaGateway | OpenAIGateway":
+    # mojentic takes seconds to import; defer it until a gateway is actually needed.
+    from mojentic.llm.gateways import OllamaGateway, OpenAIGateway
+
+    if provider == "ollama":
+        return OllamaGateway()
     return OpenAIGateway(api_key=api_key)
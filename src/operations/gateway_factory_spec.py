@@ -2,7 +2,7 @@
 
 import pytest
 
-from operations.gateway_factory import MissingApiKeyError, create_gateway
+from operations.gateway_factory import MissingApiKeyError, create_gateway, require_api_key
 
 
 def should_create_ollama_gateway():
@@ -29,3 +29,33 @@ def should_raise_missing_api_key_for_openai_without_env(monkeypatch):
 def should_raise_value_error_for_unknown_provider():
     with pytest.raises(ValueError, match="Unknown provider"):
         create_gateway("unknown")
+
+
+def should_reuse_gateway_for_repeated_calls():
+    first = create_gateway("ollama")
+
+    second = create_gateway("ollama")
+
+    assert second is first
+
+
+def should_create_new_openai_gateway_when_api_key_changes(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "first-key")
+    first = create_gateway("openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "second-key")
+
+    second = create_gateway("openai")
+
+    assert second is not first
+
+
+def should_require_no_api_key_for_ollama(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+
+    assert require_api_key("ollama") is None
+
+
+def should_return_openai_api_key_from_env(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+    assert require_api_key("openai") == "test-key"
@@ -5,6 +5,7 @@ from pydantic import BaseModel, ConfigDict, Field
 
 
 class ProposedName(BaseModel):
+    model_config = ConfigDict(frozen=True)
 
     stem: str = Field(..., description="The stem of the filename")
     extension: str = Field(..., description="The extension of the filename. May or may not include the leading dot")
@@ -29,6 +30,7 @@ class ProposedName(BaseModel):
 
 
 class ImageAnalysis(BaseModel):
+    model_config = ConfigDict(frozen=True)
 
     current_name_suitable: bool = Field(
         ...,
@@ -44,6 +46,19 @@ class ImageAnalysis(BaseModel):
     )
 
 
+class BatchImageAnalysisItem(ImageAnalysis):
+
+    image_number: int = Field(..., description="1-based position of the analyzed image in the request")
+
+
+class BatchImageAnalysis(BaseModel):
+
+    analyses: list[BatchImageAnalysisItem] = Field(
+        ...,
+        description="Exactly one analysis per image, in the order the images were given"
+    )
+
+
 class MarkdownReference(BaseModel):
     file_path: Path = Field(..., description="Path to the markdown file")
     line_number: int = Field(..., description="Line number (1-indexed)")
@@ -52,6 +67,18 @@ class MarkdownReference(BaseModel):
     ref_type: str = Field(..., description="Type of reference")
 
 
+class ReferenceCandidate(BaseModel):
+    """A markdown link or embed found by a scan, not yet matched against a specific image."""
+
+    model_config = ConfigDict(frozen=True)
+
+    file_path: Path = Field(..., description="Path to the markdown file")
+    line_number: int = Field(..., description="Line number (1-indexed)")
+    original_text: str = Field(..., description="Original reference text")
+    target: str = Field(..., description="Link target exactly as written (wiki name or path)")
+    ref_type: str = Field(..., description="Type of reference")
+
+
 class ReferenceUpdate(BaseModel):
     file_path: Path = Field(..., description="Path to the updated markdown file")
     replacement_count: int = Field(..., description="Number of replacements made")
@@ -134,6 +161,28 @@ class ResolvedName(BaseModel):
     status: RenameStatus = Field(..., description="Status of the rename operation")
 
 
+class DirectoryNames(BaseModel):
+    """Collision state for one directory within a batch."""
+
+    existing: frozenset[str] = Field(
+        ..., description="Directory contents snapshotted on first collision check, normalized for comparison"
+    )
+    next_suffix: dict[str, int] = Field(
+        default_factory=dict, description="Next collision suffix to try, keyed by normalized base filename"
+    )
+
+
+class PlannedNames(BaseModel):
+    """Filenames reserved so far in a batch, used for cross-file collision resolution."""
+
+    names: set[str] = Field(
+        default_factory=set, description="Final filenames already planned in this batch, normalized for comparison"
+    )
+    directories: dict[Path, DirectoryNames] = Field(
+        default_factory=dict, description="Per-directory collision state, keyed by directory"
+    )
+
+
 class FolderStatistics(BaseModel):
     """Statistics for a batch folder processing operation."""
 
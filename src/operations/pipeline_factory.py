@@ -1,13 +1,14 @@
 """Factory for the gateway -> broker -> cache -> analyzer pipeline."""
 
+import functools
 from collections.abc import Callable
 from pathlib import Path
 from typing import Annotated, Any
 
 from pydantic import BaseModel, ConfigDict, SkipValidation
-from mojentic.llm import LLMBroker
 
 from operations.adapters import FilesystemAnalysisCache, MojenticImageAnalyzer
+from operations.downscale_image import downscale_for_upload
 from operations.gateway_factory import create_gateway
 from operations.ports import AnalysisCachePort, ImageAnalyzerPort
 
@@ -27,17 +28,25 @@ def build_analysis_pipeline(
     cache_root: Path,
     *,
     create_gateway_fn: Callable[[str], Any] = create_gateway,
-    broker_cls: Callable[..., Any] = LLMBroker,
+    broker_cls: Callable[..., Any] | None = None,
     cache_cls: type[FilesystemAnalysisCache] = FilesystemAnalysisCache,
     analyzer_cls: type[MojenticImageAnalyzer] = MojenticImageAnalyzer,
 ) -> AnalysisPipeline:
     """Build the full analysis pipeline from provider configuration.
 
     Raises MissingApiKeyError if the provider requires an API key not present
-    in the environment.
+    in the environment. ``broker_cls`` defaults to mojentic's ``LLMBroker``,
+    imported here rather than at module load to keep CLI startup fast. Images
+    sent to the model are downscaled first, with resized copies kept under
+    ``cache/resized``.
     """
+    if broker_cls is None:
+        from mojentic.llm import LLMBroker
+        broker_cls = LLMBroker
     gateway = create_gateway_fn(provider)
     llm = broker_cls(gateway=gateway, model=model)
     cache = cache_cls(cache_root / "cache" / "unified", provider=provider, model=model)
-    analyzer = analyzer_cls(llm)
+    analyzer = analyzer_cls(
+        llm, prepare_fn=functools.partial(downscale_for_upload, cache_dir=cache_root / "cache" / "resized")
+    )
     return AnalysisPipeline(analyzer=analyzer, cache=cache, provider=provider, model=model)
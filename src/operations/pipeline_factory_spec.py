@@ -1,7 +1,10 @@
 """Tests for the analysis pipeline factory."""
 
+from unittest.mock import ANY
+
 import pytest
 
+from operations.downscale_image import downscale_for_upload
 from operations.gateway_factory import MissingApiKeyError
 from operations.pipeline_factory import AnalysisPipeline, build_analysis_pipeline
 
@@ -69,7 +72,21 @@ def should_construct_mojentic_image_analyzer_with_broker(all_mocks, tmp_path):
         analyzer_cls=all_mocks["MojenticImageAnalyzer"],
     )
 
-    all_mocks["MojenticImageAnalyzer"].assert_called_once_with(fake_broker)
+    all_mocks["MojenticImageAnalyzer"].assert_called_once_with(fake_broker, prepare_fn=ANY)
+
+
+def should_downscale_uploads_into_resized_cache_subpath(all_mocks, tmp_path):
+    build_analysis_pipeline(
+        "ollama", "gemma3:27b", tmp_path,
+        create_gateway_fn=all_mocks["create_gateway"],
+        broker_cls=all_mocks["LLMBroker"],
+        cache_cls=all_mocks["FilesystemAnalysisCache"],
+        analyzer_cls=all_mocks["MojenticImageAnalyzer"],
+    )
+
+    prepare_fn = all_mocks["MojenticImageAnalyzer"].call_args.kwargs["prepare_fn"]
+    assert prepare_fn.func is downscale_for_upload
+    assert prepare_fn.keywords == {"cache_dir": tmp_path / "cache" / "resized"}
 
 
 def should_return_analysis_pipeline_with_correct_provider(all_mocks, tmp_path):
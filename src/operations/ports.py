@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
 from operations.models import ImageAnalysis
 
@@ -35,6 +35,18 @@ class ImageAnalyzerPort(Protocol):
         ...
 
 
+@runtime_checkable
+class BatchImageAnalyzerPort(ImageAnalyzerPort, Protocol):
+
+    def analyze_batch(
+        self,
+        paths: list[Path],
+        current_names: list[str],
+    ) -> list[ImageAnalysis]:
+        """Analyze several images in one request, returning one analysis per path in order."""
+        ...
+
+
 class FileRenamerPort(Protocol):
 
     def rename(self, source: Path, destination: Path) -> None:
@@ -1,10 +1,21 @@
 """Batch folder processing: pure functions for multiple images and statistics."""
 
+import itertools
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from operations.models import FolderStatistics, ProcessingResult, RenameStatus
-from operations.ports import AnalysisCachePort, ImageAnalyzerPort, ProgressCallback
-from operations.process_image import process_single_image
+from operations.models import AnalysisResult, FolderStatistics, PlannedNames, ProcessingResult, RenameStatus
+from operations.ports import AnalysisCachePort, BatchImageAnalyzerPort, ImageAnalyzerPort, ProgressCallback
+from operations.process_image import (
+    build_error_result,
+    build_processing_result,
+    build_rubric_skip_result,
+    follows_naming_rubric,
+    try_get_or_generate_analyses,
+    try_get_or_generate_analysis,
+)
 
 
 def process_folder(
@@ -12,19 +23,96 @@ def process_folder(
     analyzer: ImageAnalyzerPort,
     cache: AnalysisCachePort,
     progress: ProgressCallback | None = None,
+    *,
+    concurrency: int = 1,
+    skip_conforming: bool = False,
+    batch_size: int = 1,
 ) -> list[ProcessingResult]:
-    """Process all image files in a list, tracking cross-file name collisions."""
-    planned_names: set[str] = set()
-    return [
-        process_single_image(img, analyzer, cache, planned_names, progress)
-        for img in image_files
-    ]
+    """Process all image files in a list, tracking cross-file name collisions.
+
+    Analyses (cache lookup or LLM call) run on up to ``concurrency`` worker
+    threads, so ``progress`` may be called from several threads at once.
+    Collision resolution then runs sequentially in ``image_files`` order, keeping
+    final names and result order identical to a sequential run.
+
+    With ``skip_conforming``, images whose names already follow the naming
+    rubric are reported UNCHANGED without a cache lookup or LLM call. With
+    ``batch_size`` above one and an analyzer implementing
+    ``BatchImageAnalyzerPort``, cache misses are analyzed up to ``batch_size``
+    images per request.
+    """
+    return list(iter_process_folder(
+        image_files, analyzer, cache, progress,
+        concurrency=concurrency, skip_conforming=skip_conforming, batch_size=batch_size,
+    ))
+
+
+def iter_process_folder(
+    image_files: list[Path],
+    analyzer: ImageAnalyzerPort,
+    cache: AnalysisCachePort,
+    progress: ProgressCallback | None = None,
+    *,
+    concurrency: int = 1,
+    skip_conforming: bool = False,
+    batch_size: int = 1,
+) -> Iterator[ProcessingResult]:
+    """Yield processing results in ``image_files`` order as soon as each is ready.
+
+    Behaves like ``process_folder`` but lets callers show results while later
+    images are still being analyzed. A result is yielded once its own analysis
+    and all earlier ones have finished, since collision resolution depends on
+    the names planned before it. Closing the generator early cancels analyses
+    that have not started yet.
+    """
+    skipped = [skip_conforming and follows_naming_rubric(img) for img in image_files]
+    executor = ThreadPoolExecutor(max_workers=max(1, concurrency))
+    try:
+        analyses = _map_analyses(
+            executor,
+            [img for img, skip in zip(image_files, skipped) if not skip],
+            analyzer, cache, progress, batch_size,
+        )
+        planned_names = PlannedNames()
+        for img, skip in zip(image_files, skipped):
+            if skip:
+                yield build_rubric_skip_result(img)
+                continue
+            analysis = next(analyses)
+            if analysis is None:
+                yield build_error_result(img)
+            else:
+                yield build_processing_result(img, analysis.analysis, analysis.cached, planned_names)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _map_analyses(
+    executor: ThreadPoolExecutor,
+    images: list[Path],
+    analyzer: ImageAnalyzerPort,
+    cache: AnalysisCachePort,
+    progress: ProgressCallback | None,
+    batch_size: int,
+) -> Iterator[AnalysisResult | None]:
+    if batch_size > 1 and isinstance(analyzer, BatchImageAnalyzerPort):
+        batch_analyzer = analyzer
+        chunks = executor.map(
+            lambda chunk: try_get_or_generate_analyses(list(chunk), batch_analyzer, cache, progress),
+            itertools.batched(images, batch_size),
+        )
+        return itertools.chain.from_iterable(chunks)
+    return executor.map(
+        lambda img: try_get_or_generate_analysis(img, analyzer, cache, progress),
+        images,
+    )
 
 
 def compute_statistics(results: list[ProcessingResult]) -> FolderStatistics:
+    counts = Counter(r.status for r in results)
     return FolderStatistics(
-        renamed=sum(1 for r in results if r.status == RenameStatus.RENAMED),
-        unchanged=sum(1 for r in results if r.status == RenameStatus.UNCHANGED),
-        collision=sum(1 for r in results if r.status == RenameStatus.COLLISION),
-        error=sum(1 for r in results if r.status == RenameStatus.ERROR),
+        renamed=counts[RenameStatus.RENAMED],
+        unchanged=counts[RenameStatus.UNCHANGED],
+        collision=counts[RenameStatus.COLLISION],
+        error=counts[RenameStatus.ERROR],
     )
@@ -1,8 +1,11 @@
 """Tests for batch folder processing orchestration."""
 
+import threading
+
 from conftest import make_analysis
 from operations.models import ProcessingResult, RenameStatus
-from operations.process_folder import compute_statistics, process_folder
+from operations.ports import BatchImageAnalyzerPort
+from operations.process_folder import compute_statistics, iter_process_folder, process_folder
 
 
 def should_return_empty_list_for_empty_input(mock_cache, mock_analyzer):
@@ -48,6 +51,71 @@ def should_track_planned_names_across_images(tmp_path, mock_cache, mock_analyzer
     assert results[1].final == "same-name-2.png"
 
 
+def should_analyze_images_concurrently_when_concurrency_above_one(tmp_path, mock_cache, mock_analyzer):
+    imgs = [tmp_path / "a.png", tmp_path / "b.png"]
+    for img in imgs:
+        img.write_bytes(b"x")
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_analyze(path, name):
+        barrier.wait()
+        return make_analysis(suitable=False, stem=f"{path.stem}-renamed", reasoning="")
+
+    mock_cache.load.return_value = None
+    mock_analyzer.analyze.side_effect = fake_analyze
+
+    results = process_folder(imgs, mock_analyzer, mock_cache, concurrency=2)
+
+    assert [r.final for r in results] == ["a-renamed.png", "b-renamed.png"]
+
+
+def should_yield_first_result_before_later_analyses_finish(tmp_path, mock_cache, mock_analyzer):
+    imgs = [tmp_path / "a.png", tmp_path / "b.png"]
+    for img in imgs:
+        img.write_bytes(b"x")
+    first_yielded = threading.Event()
+
+    def fake_analyze(path, name):
+        if path.name == "b.png":
+            assert first_yielded.wait(timeout=5)
+        return make_analysis(suitable=False, stem=f"{path.stem}-renamed", reasoning="")
+
+    mock_cache.load.return_value = None
+    mock_analyzer.analyze.side_effect = fake_analyze
+
+    stream = iter_process_folder(imgs, mock_analyzer, mock_cache, concurrency=2)
+    first = next(stream)
+    first_yielded.set()
+
+    assert first.final == "a-renamed.png"
+    assert [r.final for r in stream] == ["b-renamed.png"]
+
+
+def should_resolve_collisions_in_input_order_when_concurrent(tmp_path, mock_cache, mock_analyzer):
+    imgs = [tmp_path / f"img{i}.png" for i in range(4)]
+    for img in imgs:
+        img.write_bytes(b"x")
+
+    mock_cache.load.return_value = None
+    mock_analyzer.analyze.return_value = make_analysis(suitable=False, stem="same-name", reasoning="")
+
+    results = process_folder(imgs, mock_analyzer, mock_cache, concurrency=4)
+
+    assert [r.final for r in results] == ["same-name.png", "same-name-2.png", "same-name-3.png", "same-name-4.png"]
+
+
+def should_report_error_result_for_failed_analysis_in_batch(tmp_path, mock_cache, mock_analyzer):
+    img = tmp_path / "a.png"
+    img.write_bytes(b"x")
+
+    mock_cache.load.return_value = None
+    mock_analyzer.analyze.side_effect = ConnectionError("LLM unavailable")
+
+    results = process_folder([img], mock_analyzer, mock_cache, concurrency=2)
+
+    assert results[0].status == RenameStatus.ERROR
+
+
 def should_count_all_statuses():
     results = [
         ProcessingResult(source="a.png", proposed="x.png", final="x.png", status=RenameStatus.RENAMED),
@@ -83,3 +151,58 @@ def should_handle_all_same_status():
 
     assert stats.unchanged == 5
     assert stats.renamed == 0
+
+
+def should_skip_analysis_for_rubric_names_when_skip_conforming(tmp_path, mock_cache, mock_analyzer):
+    conforming = tmp_path / "sales-chart--quarterly-revenue-2024.png"
+    other = tmp_path / "IMG_0001.png"
+    for img in (conforming, other):
+        img.write_bytes(b"x")
+
+    mock_cache.load.return_value = None
+    mock_analyzer.analyze.return_value = make_analysis(suitable=False, stem="new-name", reasoning="")
+
+    results = process_folder([conforming, other], mock_analyzer, mock_cache, skip_conforming=True)
+
+    assert [r.status for r in results] == [RenameStatus.UNCHANGED, RenameStatus.RENAMED]
+    mock_analyzer.analyze.assert_called_once_with(other, other.name)
+    mock_cache.load.assert_called_once_with(other, other.name)
+
+
+def should_analyze_rubric_names_by_default(tmp_path, mock_cache, mock_analyzer):
+    conforming = tmp_path / "sales-chart--quarterly-revenue-2024.png"
+    conforming.write_bytes(b"x")
+
+    mock_cache.load.return_value = None
+    mock_analyzer.analyze.return_value = make_analysis(suitable=True, reasoning="")
+
+    process_folder([conforming], mock_analyzer, mock_cache)
+
+    mock_analyzer.analyze.assert_called_once()
+
+
+def should_analyze_in_chunks_when_batch_size_above_one(tmp_path, mock_cache, mocker):
+    imgs = [tmp_path / f"img{i}.png" for i in range(3)]
+    for img in imgs:
+        img.write_bytes(b"x")
+    analyzer = mocker.Mock(spec=BatchImageAnalyzerPort)
+    analyzer.analyze_batch.side_effect = lambda paths, names: [
+        make_analysis(suitable=False, stem=f"{p.stem}-renamed", reasoning="") for p in paths
+    ]
+    mock_cache.load.return_value = None
+
+    results = process_folder(imgs, analyzer, mock_cache, batch_size=2)
+
+    assert [r.final for r in results] == ["img0-renamed.png", "img1-renamed.png", "img2-renamed.png"]
+    assert [c.args[0] for c in analyzer.analyze_batch.call_args_list] == [imgs[:2], imgs[2:]]
+    analyzer.analyze.assert_not_called()
+
+
+def should_ignore_batch_size_when_analyzer_has_no_batch_support(tmp_path, mock_cache, mock_analyzer):
+    imgs = [tmp_path / "a.png", tmp_path / "b.png"]
+    mock_cache.load.return_value = None
+    mock_analyzer.analyze.return_value = make_analysis(suitable=True, reasoning="")
+
+    process_folder(imgs, mock_analyzer, mock_cache, batch_size=2)
+
+    assert mock_analyzer.analyze.call_count == 2
@@ -1,15 +1,57 @@
 """Single-image processing: assess, name, and resolve collisions via injected ports."""
 
 import logging
+import re
 from pathlib import Path
 
+from pydantic import ValidationError
+
 from constants import FILESYSTEM_IO_ERRORS, LLM_OPERATIONAL_ERRORS
-from operations.models import AnalysisResult, ImageAnalysis, ProcessingResult, ProposedName, RenameStatus, ResolvedName
-from operations.ports import AnalysisCachePort, ImageAnalyzerPort, ProgressCallback
-from utils.fs import next_available_name
+from operations.analyze_image import BatchResponseMismatchError
+from operations.models import (
+    AnalysisResult,
+    DirectoryNames,
+    ImageAnalysis,
+    PlannedNames,
+    ProcessingResult,
+    ProposedName,
+    RenameStatus,
+    ResolvedName,
+)
+from operations.ports import AnalysisCachePort, BatchImageAnalyzerPort, ImageAnalyzerPort, ProgressCallback
+from utils.fs import list_dir_names, normalize_name, probe_available_name
 
 logger = logging.getLogger(__name__)
 
+# A batch response that is malformed or cannot be matched to its images, and LLM
+# failures, fall back to one request per image. Other ValueErrors are bugs and
+# propagate, as on the single-image path.
+_BATCH_FALLBACK_ERRORS: tuple[type[Exception], ...] = (
+    *LLM_OPERATIONAL_ERRORS, BatchResponseMismatchError, ValidationError,
+)
+
+# Mirrors the rubric in analyze_image.UNIFIED_PROMPT: lowercase hyphenated words,
+# <primary-subject>--<specific-detail>, 5-8 words, at most 80 characters.
+_RUBRIC_STEM_RE = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*--[a-z0-9]+(?:-[a-z0-9]+)*")
+_RUBRIC_MIN_WORDS = 5
+_RUBRIC_MAX_WORDS = 8
+_RUBRIC_MAX_LENGTH = 80
+RUBRIC_SKIP_REASONING = "Filename already follows the naming rubric; analysis skipped"
+
+
+def follows_naming_rubric(img_path: Path) -> bool:
+    """Check whether a filename already has the shape the naming rubric asks for.
+
+    A purely syntactic check: it cannot tell whether the name matches the image
+    content, so callers use it only to skip analysis when the user has not
+    asked to force it.
+    """
+    stem = img_path.stem
+    if len(img_path.name) > _RUBRIC_MAX_LENGTH or _RUBRIC_STEM_RE.fullmatch(stem) is None:
+        return False
+    word_count = stem.count("-") - stem.count("--") + 1
+    return _RUBRIC_MIN_WORDS <= word_count <= _RUBRIC_MAX_WORDS
+
 
 def get_or_generate_analysis(
     img_path: Path,
@@ -32,6 +74,16 @@ def get_or_generate_analysis(
     if progress is not None:
         progress.on_cache_miss(img_path)
     analysis = analyzer.analyze(img_path, current_name)
+    return _save_fresh_analysis(img_path, current_name, analysis, cache, progress)
+
+
+def _save_fresh_analysis(
+    img_path: Path,
+    current_name: str,
+    analysis: ImageAnalysis,
+    cache: AnalysisCachePort,
+    progress: ProgressCallback | None,
+) -> AnalysisResult:
     persisted = True
     try:
         cache.save(img_path, current_name, analysis)
@@ -46,12 +98,14 @@ def get_or_generate_analysis(
 def resolve_final_name(
     img_path: Path,
     proposed: ProposedName,
-    planned_names: set[str],
+    planned_names: PlannedNames,
 ) -> ResolvedName:
     """Resolve proposed name to a final filename, handling idempotency and collisions.
 
     Mutates ``planned_names`` by adding the resolved final filename when a rename
-    is needed (RENAMED or COLLISION status).
+    is needed (RENAMED or COLLISION status). The image's directory is listed and
+    normalized once per ``planned_names`` and reused for later images in the
+    same directory, so the snapshot must not outlive the batch that created it.
     """
     proposed_stem = proposed.stem
     proposed_filename = proposed.filename_with_fallback(img_path.suffix)
@@ -64,10 +118,18 @@ def resolve_final_name(
             status=RenameStatus.UNCHANGED,
         )
 
-    final_name = next_available_name(img_path.parent, proposed_stem, proposed_ext, planned_names=planned_names)
+    directory = img_path.parent
+    dir_names = planned_names.directories.get(directory)
+    if dir_names is None:
+        existing = frozenset(normalize_name(name) for name in list_dir_names(directory))
+        dir_names = planned_names.directories[directory] = DirectoryNames(existing=existing)
+    final_name = probe_available_name(
+        proposed_stem, proposed_ext, dir_names.existing, planned_names.names,
+        next_suffix=dir_names.next_suffix,
+    )
     status = RenameStatus.RENAMED if final_name == proposed_filename else RenameStatus.COLLISION
 
-    planned_names.add(final_name)
+    planned_names.names.add(normalize_name(final_name))
     return ResolvedName(proposed_filename=proposed_filename, final_name=final_name, status=status)
 
 
@@ -75,7 +137,7 @@ def build_processing_result(
     img_path: Path,
     analysis: ImageAnalysis,
     cached: bool,
-    planned_names: set[str],
+    planned_names: PlannedNames,
 ) -> ProcessingResult:
     """Build a ProcessingResult from an analysis, handling suitability and collision resolution."""
     if analysis.current_name_suitable:
@@ -101,34 +163,123 @@ def build_processing_result(
     )
 
 
-def process_single_image(
+def build_rubric_skip_result(img_path: Path) -> ProcessingResult:
+    """Build the UNCHANGED ProcessingResult reported for a name that skipped analysis."""
+    return ProcessingResult(
+        source=img_path.name,
+        proposed=img_path.name,
+        final=img_path.name,
+        status=RenameStatus.UNCHANGED,
+        path=img_path,
+        reasoning=RUBRIC_SKIP_REASONING,
+    )
+
+
+def build_error_result(img_path: Path) -> ProcessingResult:
+    """Build the ProcessingResult reported for an image whose analysis failed."""
+    return ProcessingResult(
+        source=img_path.name,
+        proposed="ERROR",
+        final=img_path.name,
+        status=RenameStatus.ERROR,
+    )
+
+
+def try_get_or_generate_analysis(
     img_path: Path,
     analyzer: ImageAnalyzerPort,
     cache: AnalysisCachePort,
-    planned_names: set[str],
     progress: ProgressCallback | None = None,
-) -> ProcessingResult:
-    """Process a single image file to determine its new name.
+) -> AnalysisResult | None:
+    """Get analysis from cache or analyzer, returning None (and logging) on LLM failure.
 
-    Uses a unified single-LLM-call strategy (assess + name in one call) with
-    cache-first optimisation. All errors are captured in the result rather than raised.
+    Touches no shared state, so it is safe to call concurrently for different images.
+    """
+    try:
+        return get_or_generate_analysis(img_path, img_path.name, analyzer, cache, progress)
+    except LLM_OPERATIONAL_ERRORS as e:
+        logger.warning(
+            "Failed to process %s: %s: %s", img_path.name, type(e).__name__, e
+        )
+        return None
+
+
+def try_get_or_generate_analyses(
+    img_paths: list[Path],
+    analyzer: BatchImageAnalyzerPort,
+    cache: AnalysisCachePort,
+    progress: ProgressCallback | None = None,
+) -> list[AnalysisResult | None]:
+    """Batched ``try_get_or_generate_analysis``: one analyzer request for all cache misses.
+
+    Cache hits are served individually; the remaining images go to
+    ``analyzer.analyze_batch`` together. If the batch request fails or its
+    response cannot be matched to the images, each miss is retried with a
+    single-image request. Returns one entry per path, None where analysis failed.
     """
-    current_name = img_path.name
+    results: list[AnalysisResult | None] = [None] * len(img_paths)
+    misses: list[int] = []
+    for i, img_path in enumerate(img_paths):
+        analysis = cache.load(img_path, img_path.name)
+        if analysis is not None:
+            if progress is not None:
+                progress.on_cache_hit(img_path, analysis)
+            results[i] = AnalysisResult(analysis=analysis, cached=True)
+            continue
+        if progress is not None:
+            progress.on_cache_miss(img_path)
+        misses.append(i)
+    if not misses:
+        return results
 
+    miss_paths = [img_paths[i] for i in misses]
     try:
-        analysis_result = get_or_generate_analysis(
-            img_path, current_name, analyzer, cache, progress
+        analyses = analyzer.analyze_batch(miss_paths, [p.name for p in miss_paths])
+    except _BATCH_FALLBACK_ERRORS as e:
+        logger.warning(
+            "Batch analysis of %d image(s) failed, retrying individually: %s: %s",
+            len(miss_paths), type(e).__name__, e,
         )
+        for i in misses:
+            results[i] = _try_analyze_uncached(img_paths[i], analyzer, cache, progress)
+        return results
+
+    for i, analysis in zip(misses, analyses):
+        results[i] = _save_fresh_analysis(img_paths[i], img_paths[i].name, analysis, cache, progress)
+    return results
+
+
+def _try_analyze_uncached(
+    img_path: Path,
+    analyzer: ImageAnalyzerPort,
+    cache: AnalysisCachePort,
+    progress: ProgressCallback | None,
+) -> AnalysisResult | None:
+    try:
+        analysis = analyzer.analyze(img_path, img_path.name)
     except LLM_OPERATIONAL_ERRORS as e:
         logger.warning(
             "Failed to process %s: %s: %s", img_path.name, type(e).__name__, e
         )
-        return ProcessingResult(
-            source=img_path.name,
-            proposed="ERROR",
-            final=img_path.name,
-            status=RenameStatus.ERROR,
-        )
+        return None
+    return _save_fresh_analysis(img_path, img_path.name, analysis, cache, progress)
+
+
+def process_single_image(
+    img_path: Path,
+    analyzer: ImageAnalyzerPort,
+    cache: AnalysisCachePort,
+    planned_names: PlannedNames,
+    progress: ProgressCallback | None = None,
+) -> ProcessingResult:
+    """Process a single image file to determine its new name.
+
+    Uses a unified single-LLM-call strategy (assess + name in one call) with
+    cache-first optimisation. All errors are captured in the result rather than raised.
+    """
+    analysis_result = try_get_or_generate_analysis(img_path, analyzer, cache, progress)
+    if analysis_result is None:
+        return build_error_result(img_path)
 
     return build_processing_result(
         img_path, analysis_result.analysis, analysis_result.cached, planned_names
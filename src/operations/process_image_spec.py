@@ -5,13 +5,19 @@ import logging
 import pytest
 
 from conftest import make_analysis
-from operations.models import ProposedName, RenameStatus
+from operations.analyze_image import BatchResponseMismatchError
+from operations.models import PlannedNames, ProposedName, RenameStatus
 from operations.process_image import (
     build_processing_result,
+    build_rubric_skip_result,
+    follows_naming_rubric,
     get_or_generate_analysis,
     process_single_image,
     resolve_final_name,
+    try_get_or_generate_analyses,
 )
+from operations.ports import BatchImageAnalyzerPort
+from utils.fs import list_dir_names
 
 
 # ---------------------------------------------------------------------------
@@ -21,7 +27,7 @@ from operations.process_image import (
 def should_return_unchanged_when_analysis_is_suitable(tmp_image_path):
     analysis = make_analysis(suitable=True)
 
-    result = build_processing_result(tmp_image_path, analysis, cached=False, planned_names=set())
+    result = build_processing_result(tmp_image_path, analysis, cached=False, planned_names=PlannedNames())
 
     assert result.status == RenameStatus.UNCHANGED
     assert result.proposed == tmp_image_path.name
@@ -33,7 +39,7 @@ def should_return_renamed_when_analysis_needs_new_name(tmp_path):
     img.write_bytes(b"x")
     analysis = make_analysis(suitable=False, stem="new-name")
 
-    result = build_processing_result(img, analysis, cached=False, planned_names=set())
+    result = build_processing_result(img, analysis, cached=False, planned_names=PlannedNames())
 
     assert result.status == RenameStatus.RENAMED
     assert result.proposed == "new-name.png"
@@ -46,7 +52,7 @@ def should_return_collision_when_target_name_already_taken(tmp_path):
     (tmp_path / "taken-name.png").write_bytes(b"existing")
     analysis = make_analysis(suitable=False, stem="taken-name")
 
-    result = build_processing_result(img, analysis, cached=False, planned_names=set())
+    result = build_processing_result(img, analysis, cached=False, planned_names=PlannedNames())
 
     assert result.status == RenameStatus.COLLISION
     assert result.final == "taken-name-2.png"
@@ -55,7 +61,7 @@ def should_return_collision_when_target_name_already_taken(tmp_path):
 def should_propagate_cached_flag_to_processing_result(tmp_image_path):
     analysis = make_analysis(suitable=True)
 
-    result = build_processing_result(tmp_image_path, analysis, cached=True, planned_names=set())
+    result = build_processing_result(tmp_image_path, analysis, cached=True, planned_names=PlannedNames())
 
     assert result.cached is True
 
@@ -67,7 +73,7 @@ def should_propagate_cached_flag_to_processing_result(tmp_image_path):
 def should_return_unchanged_when_cached_analysis_is_suitable(tmp_image_path, mock_cache, mock_analyzer):
     mock_cache.load.return_value = make_analysis()
 
-    result = process_single_image(tmp_image_path, mock_analyzer, mock_cache, set())
+    result = process_single_image(tmp_image_path, mock_analyzer, mock_cache, PlannedNames())
 
     assert result.status == RenameStatus.UNCHANGED
     assert result.final == tmp_image_path.name
@@ -76,7 +82,7 @@ def should_return_unchanged_when_cached_analysis_is_suitable(tmp_image_path, moc
 def should_not_call_analyze_when_cached_analysis_is_suitable(tmp_image_path, mock_cache, mock_analyzer):
     mock_cache.load.return_value = make_analysis()
 
-    process_single_image(tmp_image_path, mock_analyzer, mock_cache, set())
+    process_single_image(tmp_image_path, mock_analyzer, mock_cache, PlannedNames())
 
     mock_analyzer.analyze.assert_not_called()
 
@@ -85,7 +91,7 @@ def should_call_analyzer_on_cache_miss(tmp_image_path, mock_cache, mock_analyzer
     mock_cache.load.return_value = None
     mock_analyzer.analyze.return_value = make_analysis()
 
-    process_single_image(tmp_image_path, mock_analyzer, mock_cache, set())
+    process_single_image(tmp_image_path, mock_analyzer, mock_cache, PlannedNames())
 
     mock_analyzer.analyze.assert_called_once()
 
@@ -94,7 +100,7 @@ def should_save_analysis_to_cache_on_cache_miss(tmp_image_path, mock_cache, mock
     mock_cache.load.return_value = None
     mock_analyzer.analyze.return_value = make_analysis()
 
-    process_single_image(tmp_image_path, mock_analyzer, mock_cache, set())
+    process_single_image(tmp_image_path, mock_analyzer, mock_cache, PlannedNames())
 
     mock_cache.save.assert_called_once()
 
@@ -103,7 +109,7 @@ def should_return_unchanged_status_on_cache_miss_with_suitable_analysis(tmp_imag
     mock_cache.load.return_value = None
     mock_analyzer.analyze.return_value = make_analysis()
 
-    result = process_single_image(tmp_image_path, mock_analyzer, mock_cache, set())
+    result = process_single_image(tmp_image_path, mock_analyzer, mock_cache, PlannedNames())
 
     assert result.status == RenameStatus.UNCHANGED
 
@@ -112,7 +118,7 @@ def should_return_error_when_analyze_raises_operational_error(tmp_image_path, mo
     mock_cache.load.return_value = None
     mock_analyzer.analyze.side_effect = ConnectionError("LLM unavailable")
 
-    result = process_single_image(tmp_image_path, mock_analyzer, mock_cache, set())
+    result = process_single_image(tmp_image_path, mock_analyzer, mock_cache, PlannedNames())
 
     assert result.status == RenameStatus.ERROR
     assert result.proposed == "ERROR"
@@ -123,7 +129,7 @@ def should_not_return_error_when_cache_save_raises_oserror(tmp_image_path, mock_
     mock_analyzer.analyze.return_value = make_analysis(suitable=False, stem="new-name")
     mock_cache.save.side_effect = OSError("disk full")
 
-    result = process_single_image(tmp_image_path, mock_analyzer, mock_cache, set())
+    result = process_single_image(tmp_image_path, mock_analyzer, mock_cache, PlannedNames())
 
     assert result.status != RenameStatus.ERROR
     assert result.proposed == "new-name.png"
@@ -145,14 +151,14 @@ def should_propagate_unexpected_programmer_error(tmp_image_path, mock_cache, moc
     mock_analyzer.analyze.side_effect = ValueError("bug")
 
     with pytest.raises(ValueError):
-        process_single_image(tmp_image_path, mock_analyzer, mock_cache, set())
+        process_single_image(tmp_image_path, mock_analyzer, mock_cache, PlannedNames())
 
 
 def should_return_error_status_on_connection_error(tmp_image_path, mock_cache, mock_analyzer):
     mock_cache.load.return_value = None
     mock_analyzer.analyze.side_effect = ConnectionError("Network unavailable")
 
-    result = process_single_image(tmp_image_path, mock_analyzer, mock_cache, set())
+    result = process_single_image(tmp_image_path, mock_analyzer, mock_cache, PlannedNames())
 
     assert result.status == RenameStatus.ERROR
 
@@ -162,7 +168,7 @@ def should_log_filename_on_connection_error(tmp_image_path, mock_cache, mock_ana
     mock_analyzer.analyze.side_effect = ConnectionError("Network unavailable")
 
     with caplog.at_level(logging.WARNING, logger="operations.process_image"):
-        process_single_image(tmp_image_path, mock_analyzer, mock_cache, set())
+        process_single_image(tmp_image_path, mock_analyzer, mock_cache, PlannedNames())
 
     assert any(tmp_image_path.name in r.getMessage() for r in caplog.records)
 
@@ -172,7 +178,7 @@ def should_log_error_type_on_connection_error(tmp_image_path, mock_cache, mock_a
     mock_analyzer.analyze.side_effect = ConnectionError("Network unavailable")
 
     with caplog.at_level(logging.WARNING, logger="operations.process_image"):
-        process_single_image(tmp_image_path, mock_analyzer, mock_cache, set())
+        process_single_image(tmp_image_path, mock_analyzer, mock_cache, PlannedNames())
 
     assert any("ConnectionError" in r.getMessage() for r in caplog.records)
 
@@ -180,7 +186,7 @@ def should_log_error_type_on_connection_error(tmp_image_path, mock_cache, mock_a
 def should_propose_new_name_when_analysis_unsuitable(tmp_image_path, mock_cache, mock_analyzer):
     mock_cache.load.return_value = make_analysis(suitable=False, stem="new-name")
 
-    result = process_single_image(tmp_image_path, mock_analyzer, mock_cache, set())
+    result = process_single_image(tmp_image_path, mock_analyzer, mock_cache, PlannedNames())
 
     assert result.status == RenameStatus.RENAMED
     assert result.proposed == "new-name.png"
@@ -192,7 +198,7 @@ def should_return_unchanged_when_stem_matches_proposed(tmp_path, mock_cache, moc
     img.write_bytes(b"x")
     mock_cache.load.return_value = make_analysis(suitable=False, stem="already-named")
 
-    result = process_single_image(img, mock_analyzer, mock_cache, set())
+    result = process_single_image(img, mock_analyzer, mock_cache, PlannedNames())
 
     assert result.status == RenameStatus.UNCHANGED
     assert result.final == "already-named.png"
@@ -204,7 +210,7 @@ def should_resolve_collision_with_existing_file(tmp_path, mock_cache, mock_analy
     (tmp_path / "taken-name.png").write_bytes(b"existing")
     mock_cache.load.return_value = make_analysis(suitable=False, stem="taken-name")
 
-    result = process_single_image(img, mock_analyzer, mock_cache, set())
+    result = process_single_image(img, mock_analyzer, mock_cache, PlannedNames())
 
     assert result.status == RenameStatus.COLLISION
     assert result.final == "taken-name-2.png"
@@ -213,7 +219,7 @@ def should_resolve_collision_with_existing_file(tmp_path, mock_cache, mock_analy
 def should_resolve_collision_with_planned_names(tmp_path, mock_cache, mock_analyzer):
     img = tmp_path / "source.png"
     img.write_bytes(b"x")
-    planned = {"wanted-name.png"}
+    planned = PlannedNames(names={"wanted-name.png"})
     mock_cache.load.return_value = make_analysis(suitable=False, stem="wanted-name")
 
     result = process_single_image(img, mock_analyzer, mock_cache, planned)
@@ -225,18 +231,18 @@ def should_resolve_collision_with_planned_names(tmp_path, mock_cache, mock_analy
 def should_add_final_name_to_planned_names(tmp_path, mock_cache, mock_analyzer):
     img = tmp_path / "source.png"
     img.write_bytes(b"x")
-    planned: set[str] = set()
+    planned = PlannedNames()
     mock_cache.load.return_value = make_analysis(suitable=False, stem="new-name")
 
     process_single_image(img, mock_analyzer, mock_cache, planned)
 
-    assert "new-name.png" in planned
+    assert "new-name.png" in planned.names
 
 
 def should_populate_reasoning_on_processing_result(tmp_image_path, mock_cache, mock_analyzer):
     mock_cache.load.return_value = make_analysis(reasoning="The current name is descriptive.")
 
-    result = process_single_image(tmp_image_path, mock_analyzer, mock_cache, set())
+    result = process_single_image(tmp_image_path, mock_analyzer, mock_cache, PlannedNames())
 
     assert result.reasoning == "The current name is descriptive."
 
@@ -244,7 +250,7 @@ def should_populate_reasoning_on_processing_result(tmp_image_path, mock_cache, m
 def should_populate_cached_true_when_analysis_comes_from_cache(tmp_image_path, mock_cache, mock_analyzer):
     mock_cache.load.return_value = make_analysis()
 
-    result = process_single_image(tmp_image_path, mock_analyzer, mock_cache, set())
+    result = process_single_image(tmp_image_path, mock_analyzer, mock_cache, PlannedNames())
 
     assert result.cached is True
 
@@ -253,7 +259,7 @@ def should_populate_cached_false_when_analysis_is_freshly_generated(tmp_image_pa
     mock_cache.load.return_value = None
     mock_analyzer.analyze.return_value = make_analysis()
 
-    result = process_single_image(tmp_image_path, mock_analyzer, mock_cache, set())
+    result = process_single_image(tmp_image_path, mock_analyzer, mock_cache, PlannedNames())
 
     assert result.cached is False
 
@@ -409,7 +415,7 @@ def should_return_unchanged_when_stem_matches(tmp_path):
     img.write_bytes(b"x")
     proposed = ProposedName(stem="already-named", extension=".png")
 
-    result = resolve_final_name(img, proposed, set())
+    result = resolve_final_name(img, proposed, PlannedNames())
 
     assert result.status == RenameStatus.UNCHANGED
     assert result.final_name == img.name
@@ -420,7 +426,7 @@ def should_return_renamed_when_no_collision(tmp_path):
     img.write_bytes(b"x")
     proposed = ProposedName(stem="new-name", extension=".png")
 
-    result = resolve_final_name(img, proposed, set())
+    result = resolve_final_name(img, proposed, PlannedNames())
 
     assert result.status == RenameStatus.RENAMED
     assert result.final_name == "new-name.png"
@@ -433,7 +439,7 @@ def should_return_collision_when_disk_file_exists(tmp_path):
     (tmp_path / "taken-name.png").write_bytes(b"existing")
     proposed = ProposedName(stem="taken-name", extension=".png")
 
-    result = resolve_final_name(img, proposed, set())
+    result = resolve_final_name(img, proposed, PlannedNames())
 
     assert result.status == RenameStatus.COLLISION
     assert result.final_name == "taken-name-2.png"
@@ -443,7 +449,7 @@ def should_return_collision_when_planned_name_taken(tmp_path):
     img = tmp_path / "source.png"
     img.write_bytes(b"x")
     proposed = ProposedName(stem="wanted-name", extension=".png")
-    planned = {"wanted-name.png"}
+    planned = PlannedNames(names={"wanted-name.png"})
 
     result = resolve_final_name(img, proposed, planned)
 
@@ -455,11 +461,68 @@ def should_add_resolved_name_to_planned_names(tmp_path):
     img = tmp_path / "source.png"
     img.write_bytes(b"x")
     proposed = ProposedName(stem="new-name", extension=".png")
-    planned: set[str] = set()
+    planned = PlannedNames()
 
     resolve_final_name(img, proposed, planned)
 
-    assert "new-name.png" in planned
+    assert "new-name.png" in planned.names
+
+
+def should_record_next_collision_suffix_in_planned_names(tmp_path):
+    img = tmp_path / "source.png"
+    img.write_bytes(b"x")
+    proposed = ProposedName(stem="new-name", extension=".png")
+    planned = PlannedNames()
+
+    resolve_final_name(img, proposed, planned)
+
+    assert planned.directories[tmp_path].next_suffix == {"new-name.png": 2}
+
+
+def should_track_collision_suffixes_per_directory(tmp_path):
+    dir_a, dir_b = tmp_path / "a", tmp_path / "b"
+    dir_a.mkdir()
+    dir_b.mkdir()
+    (dir_a / "photo.png").write_bytes(b"existing")
+    img_a, img_b = dir_a / "x.png", dir_b / "y.png"
+    img_a.write_bytes(b"x")
+    img_b.write_bytes(b"y")
+    planned = PlannedNames()
+    proposed = ProposedName(stem="photo", extension=".png")
+
+    result_a = resolve_final_name(img_a, proposed, planned)
+    result_b = resolve_final_name(img_b, proposed, planned)
+
+    assert (result_a.final_name, result_a.status) == ("photo-2.png", RenameStatus.COLLISION)
+    assert (result_b.final_name, result_b.status) == ("photo.png", RenameStatus.RENAMED)
+
+
+def should_list_directory_once_per_batch(tmp_path, mocker):
+    spy = mocker.patch("operations.process_image.list_dir_names", wraps=list_dir_names)
+    imgs = [tmp_path / "a.png", tmp_path / "b.png"]
+    for img in imgs:
+        img.write_bytes(b"x")
+    planned = PlannedNames()
+
+    results = [resolve_final_name(img, ProposedName(stem="same", extension=".png"), planned) for img in imgs]
+
+    assert [r.final_name for r in results] == ["same.png", "same-2.png"]
+    spy.assert_called_once_with(tmp_path)
+
+
+def should_compare_snapshot_and_planned_names_case_insensitively_on_macos(tmp_path, monkeypatch):
+    monkeypatch.setattr("utils.fs.sys.platform", "darwin")
+    (tmp_path / "Photo.png").write_bytes(b"existing")
+    imgs = [tmp_path / "a.png", tmp_path / "b.png"]
+    for img in imgs:
+        img.write_bytes(b"x")
+    planned = PlannedNames()
+
+    first = resolve_final_name(imgs[0], ProposedName(stem="photo", extension=".png"), planned)
+    second = resolve_final_name(imgs[1], ProposedName(stem="PHOTO", extension=".png"), planned)
+
+    assert first.final_name == "photo-2.png"
+    assert second.final_name == "PHOTO-3.png"
 
 
 def should_normalize_extension_without_dot(tmp_path):
@@ -467,7 +530,7 @@ def should_normalize_extension_without_dot(tmp_path):
     img.write_bytes(b"x")
     proposed = ProposedName(stem="new-name", extension="jpg")
 
-    result = resolve_final_name(img, proposed, set())
+    result = resolve_final_name(img, proposed, PlannedNames())
 
     assert result.final_name.endswith(".jpg")
 
@@ -477,6 +540,98 @@ def should_use_fallback_extension_when_empty(tmp_path):
     img.write_bytes(b"x")
     proposed = ProposedName(stem="new-name", extension="")
 
-    result = resolve_final_name(img, proposed, set())
+    result = resolve_final_name(img, proposed, PlannedNames())
 
     assert result.final_name.endswith(".png")
+
+
+# ---------------------------------------------------------------------------
+# follows_naming_rubric / build_rubric_skip_result
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("name", [
+    "sales-chart--quarterly-revenue-2024.png",
+    "golden-retriever--running-on-beach.jpg",
+])
+def should_accept_names_following_the_rubric(tmp_path, name):
+    assert follows_naming_rubric(tmp_path / name) is True
+
+
+@pytest.mark.parametrize("name", [
+    "IMG_0001.jpg",
+    "sales-chart-quarterly-revenue-2024.png",
+    "Sales-Chart--quarterly-revenue-2024.png",
+    "chart--q3.png",
+    "one-two-three-four--five-six-seven-eight-nine.png",
+    "sales-chart---quarterly-revenue-2024.png",
+    "sales-chart--" + "-".join(["revenue"] * 10) + ".png",
+])
+def should_reject_names_not_following_the_rubric(tmp_path, name):
+    assert follows_naming_rubric(tmp_path / name) is False
+
+
+def should_build_unchanged_result_for_rubric_skip(tmp_path):
+    img = tmp_path / "sales-chart--quarterly-revenue-2024.png"
+
+    result = build_rubric_skip_result(img)
+
+    assert result.status == RenameStatus.UNCHANGED
+    assert result.final == img.name
+    assert result.path == img
+
+
+# ---------------------------------------------------------------------------
+# try_get_or_generate_analyses
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def mock_batch_analyzer(mocker):
+    return mocker.Mock(spec=BatchImageAnalyzerPort)
+
+
+def should_send_only_cache_misses_in_one_batch(tmp_path, mock_cache, mock_batch_analyzer):
+    hit, miss_a, miss_b = tmp_path / "hit.png", tmp_path / "a.png", tmp_path / "b.png"
+    cached = make_analysis(suitable=True)
+    fresh = [make_analysis(suitable=False, stem="new-a"), make_analysis(suitable=False, stem="new-b")]
+    mock_cache.load.side_effect = lambda path, name: cached if path == hit else None
+    mock_batch_analyzer.analyze_batch.return_value = fresh
+
+    results = try_get_or_generate_analyses([miss_a, hit, miss_b], mock_batch_analyzer, mock_cache)
+
+    mock_batch_analyzer.analyze_batch.assert_called_once_with([miss_a, miss_b], ["a.png", "b.png"])
+    assert [r.analysis for r in results] == [fresh[0], cached, fresh[1]]
+    assert [r.cached for r in results] == [False, True, False]
+    assert mock_cache.save.call_count == 2
+
+
+def should_not_call_batch_analyzer_when_all_cached(tmp_path, mock_cache, mock_batch_analyzer):
+    mock_cache.load.return_value = make_analysis(suitable=True)
+
+    results = try_get_or_generate_analyses([tmp_path / "a.png"], mock_batch_analyzer, mock_cache)
+
+    assert results[0].cached is True
+    mock_batch_analyzer.analyze_batch.assert_not_called()
+
+
+def should_fall_back_to_single_requests_when_batch_response_is_unusable(
+    tmp_path, mock_cache, mock_batch_analyzer,
+):
+    imgs = [tmp_path / "a.png", tmp_path / "b.png"]
+    mock_cache.load.return_value = None
+    mock_batch_analyzer.analyze_batch.side_effect = BatchResponseMismatchError("mismatched batch")
+    mock_batch_analyzer.analyze.side_effect = [make_analysis(stem="new-a"), ConnectionError("down")]
+
+    results = try_get_or_generate_analyses(imgs, mock_batch_analyzer, mock_cache)
+
+    assert results[0] is not None and results[0].analysis.proposed_name.stem == "new-a"
+    assert results[1] is None
+    assert mock_batch_analyzer.analyze.call_count == 2
+
+
+def should_propagate_programmer_error_from_batch_analyzer(tmp_path, mock_cache, mock_batch_analyzer):
+    mock_cache.load.return_value = None
+    mock_batch_analyzer.analyze_batch.side_effect = ValueError("bug")
+
+    with pytest.raises(ValueError, match="bug"):
+        try_get_or_generate_analyses([tmp_path / "a.png"], mock_batch_analyzer, mock_cache)
+    mock_batch_analyzer.analyze.assert_not_called()
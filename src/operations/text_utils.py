@@ -1,5 +1,7 @@
 """Shared text normalization utilities for reference operations."""
+import functools
 import logging
+import re
 import unicodedata
 from pathlib import Path
 from urllib.parse import unquote
@@ -23,6 +25,16 @@ REFERENCE_PATTERNS: dict[str, str] = {
     'wiki_link': WIKI_LINK_PATTERN,
 }
 
+# Compiled once at import and shared by the scan and the rewrite. Non-embed
+# patterns get a negative lookbehind so that "![...]" is reported only as an
+# image/embed, not also as a link; anchored matches are unaffected by it.
+REFERENCE_RES: dict[str, re.Pattern[str]] = {
+    ref_type: re.compile(
+        (r'(?<!!)' if not pattern.startswith('!') else '') + pattern
+    )
+    for ref_type, pattern in REFERENCE_PATTERNS.items()
+}
+
 WIKI_REF_TYPES: frozenset[str] = frozenset({'wiki_embed', 'wiki_link'})
 
 REF_TYPE_PREFIXES: dict[str, str] = {
@@ -43,6 +55,12 @@ def normalize_spaces(text: str) -> str:
     return ' '.join(normalized.split())
 
 
+@functools.lru_cache(maxsize=4096)
+def _normalized_name(name: str) -> str:
+    # Image and reference names repeat across every line of a scan; memoize them.
+    return normalize_spaces(name)
+
+
 def normalized_name_equals(a: str, b: str) -> bool:
     """Check if two names are equal after URL decoding and Unicode space normalization."""
     if a == b:
@@ -51,7 +69,7 @@ def normalized_name_equals(a: str, b: str) -> bool:
         decoded_a = unquote(a)
         if decoded_a == b:
             return True
-        if normalize_spaces(decoded_a) == normalize_spaces(b):
+        if _normalized_name(decoded_a) == _normalized_name(b):
             return True
     except (ValueError, TypeError) as e:
         logger.debug(
@@ -60,6 +78,15 @@ def normalized_name_equals(a: str, b: str) -> bool:
     return False
 
 
+def resolve_image_path(image_path: Path) -> Path | None:
+    """Resolve image_path once for repeated ref_path_matches_image calls; None if it cannot be resolved."""
+    try:
+        return image_path.resolve()
+    except _PATH_RESOLVE_ERRORS as e:
+        logger.warning("Path resolution failed (image=%s): %s: %s", image_path, type(e).__name__, e)
+        return None
+
+
 def names_match(ref_name: str, target_name: str) -> bool:
     """Check if two filenames match by name or stem, with URL decoding and Unicode normalization."""
     if Path(ref_name).stem == Path(target_name).stem:
@@ -71,17 +98,27 @@ def names_match(ref_name: str, target_name: str) -> bool:
     return False
 
 
-def ref_path_matches_image(ref_path: Path, image_path: Path, image_name: str) -> bool:
+def ref_path_matches_image(
+    ref_path: Path,
+    image_path: Path,
+    image_name: str,
+    resolved_image: Path | None,
+) -> bool:
     """Check if a reference path (from a Markdown link) matches a given image file.
 
     Tries name-based matching first, then falls back to filesystem path resolution
     (both raw and URL-decoded) to handle encoded or relative paths.
+    ``resolved_image`` is ``resolve_image_path(image_path)``, computed once by
+    callers checking many references against one image; when it is None the
+    image could not be resolved and only name-based matching is tried.
     """
     if names_match(str(ref_path.name), image_name):
         return True
+    if resolved_image is None:
+        return False
 
     try:
-        if ref_path.resolve() == image_path.resolve():
+        if ref_path.resolve() == resolved_image:
             return True
     except _PATH_RESOLVE_ERRORS as e:
         logger.warning(
@@ -91,7 +128,7 @@ def ref_path_matches_image(ref_path: Path, image_path: Path, image_name: str) ->
 
     try:
         decoded_path = Path(unquote(str(ref_path)))
-        if decoded_path.resolve() == image_path.resolve():
+        if decoded_path.resolve() == resolved_image:
             return True
     except _URL_RESOLVE_ERRORS as e:
         logger.warning(
@@ -1,7 +1,13 @@
 """Tests for shared text normalization utilities."""
 from pathlib import Path
 
-from operations.text_utils import names_match, normalize_spaces, normalized_name_equals, ref_path_matches_image
+from operations.text_utils import (
+    names_match,
+    normalize_spaces,
+    normalized_name_equals,
+    ref_path_matches_image,
+    resolve_image_path,
+)
 
 
 def should_normalize_multiple_regular_spaces():
@@ -100,7 +106,31 @@ def should_log_warning_when_path_resolution_raises(tmp_path, mocker):
     mock_ref.resolve.side_effect = OSError("permission denied")
     warning_spy = mocker.spy(text_utils_module.logger, "warning")
 
-    result = ref_path_matches_image(mock_ref, image_path, "photo.png")
+    result = ref_path_matches_image(mock_ref, image_path, "photo.png", resolve_image_path(image_path))
 
     assert result is False
     warning_spy.assert_called()
+
+
+def should_skip_path_resolution_when_image_could_not_be_resolved(tmp_path, mocker):
+    import operations.text_utils as text_utils_module
+
+    mock_ref = mocker.MagicMock(spec=Path)
+    mock_ref.name = "other.png"
+    warning_spy = mocker.spy(text_utils_module.logger, "warning")
+
+    result = ref_path_matches_image(mock_ref, tmp_path / "photo.png", "photo.png", None)
+
+    assert result is False
+    mock_ref.resolve.assert_not_called()
+    warning_spy.assert_not_called()
+
+
+def should_match_against_pre_resolved_image_path(tmp_path, mocker):
+    ref = tmp_path / "assets" / "photo-copy.png"
+    image_path = mocker.MagicMock(spec=Path)
+
+    result = ref_path_matches_image(ref, image_path, "photo.png", resolved_image=ref.resolve())
+
+    assert result is True
+    image_path.resolve.assert_not_called()
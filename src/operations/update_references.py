@@ -1,6 +1,7 @@
 """Update markdown references to renamed images."""
 import logging
 import re
+from collections import defaultdict
 from pathlib import Path
 from urllib.parse import quote, unquote
 
@@ -10,7 +11,7 @@ from operations.ports import MarkdownFilePort
 from operations.text_utils import (
     normalize_spaces,
     normalized_name_equals,
-    REFERENCE_PATTERNS,
+    REFERENCE_RES,
     WIKI_REF_TYPES,
     REF_TYPE_PREFIXES,
 )
@@ -35,10 +36,9 @@ def update_references(
     if not references:
         return ReferenceUpdateResult()
 
-    refs_by_file: dict[Path, list[MarkdownReference]] = {
-        fp: [r for r in references if r.file_path == fp]
-        for fp in dict.fromkeys(r.file_path for r in references)
-    }
+    refs_by_file: defaultdict[Path, list[MarkdownReference]] = defaultdict(list)
+    for ref in references:
+        refs_by_file[ref.file_path].append(ref)
 
     all_updates: list[ReferenceUpdate] = []
     all_failures: list[ReferenceUpdateFailure] = []
@@ -68,10 +68,12 @@ def _update_file(
         for ref in sorted_refs:
             new_text = _generate_replacement(ref, old_name, new_name)
             if new_text != ref.original_text:
-                pattern = re.escape(ref.original_text)
-                content, count = re.subn(pattern, new_text, content, count=1)
-                replacement_count += count
-                if count == 0:
+                # Plain substring replacement: new_text is literal, not a regex template.
+                head, found, tail = content.partition(ref.original_text)
+                if found:
+                    content = head + new_text + tail
+                    replacement_count += 1
+                else:
                     failures.append(ReferenceUpdateFailure(
                         file_path=file_path,
                         line_number=ref.line_number,
@@ -111,7 +113,7 @@ def _generate_replacement(
     new_name: str
 ) -> str:
     """Preserves alt text, link text, and aliases while updating the filename."""
-    pattern = REFERENCE_PATTERNS.get(ref.ref_type)
+    pattern = REFERENCE_RES.get(ref.ref_type)
     if pattern is None:
         return ref.original_text
 
@@ -126,6 +128,10 @@ def _generate_replacement(
 
 def _replace_in_path(path_str: str, old_name: str, new_name: str) -> str:
     """Replace filename in a path string, handling URL encoding."""
+    # Without a '%' unquote is the identity, so the encoded branch can't apply
+    if '%' not in path_str:
+        return path_str.replace(old_name, new_name)
+
     # Check if path is URL-encoded by trying to decode it
     try:
         decoded = unquote(path_str)
@@ -164,8 +170,10 @@ def _find_substring_with_different_spaces(haystack: str, needle: str) -> str:
     return needle
 
 
-def _replace_standard_ref(pattern: str, prefix: str, original_text: str, old_name: str, new_name: str) -> str | None:
-    match = re.match(pattern, original_text)
+def _replace_standard_ref(
+    pattern: re.Pattern[str], prefix: str, original_text: str, old_name: str, new_name: str
+) -> str | None:
+    match = pattern.match(original_text)
     if match:
         text = match.group(1)
         old_path = match.group(2)
@@ -174,8 +182,10 @@ def _replace_standard_ref(pattern: str, prefix: str, original_text: str, old_nam
     return None
 
 
-def _replace_wiki_ref(pattern: str, prefix: str, original_text: str, old_name: str, new_name: str) -> str | None:
-    match = re.match(pattern, original_text)
+def _replace_wiki_ref(
+    pattern: re.Pattern[str], prefix: str, original_text: str, old_name: str, new_name: str
+) -> str | None:
+    match = pattern.match(original_text)
     if match:
         old_ref = match.group(1)
         alias = match.group(2)
@@ -188,16 +198,13 @@ def _replace_wiki_ref(pattern: str, prefix: str, original_text: str, old_name: s
 
 def _replace_wiki_name(wiki_ref: str, old_name: str, new_name: str) -> str:
     """Handles both full filename and stem-only references."""
-    old_stem = Path(old_name).stem
-    new_stem = Path(new_name).stem
-
     # If the reference matches the full filename, replace it
     if wiki_ref == old_name:
         return new_name
 
     # If the reference matches just the stem, replace with new stem
-    if wiki_ref == old_stem:
-        return new_stem
+    if wiki_ref == Path(old_name).stem:
+        return Path(new_name).stem
 
     # Otherwise return unchanged
     return wiki_ref
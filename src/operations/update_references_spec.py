@@ -2,6 +2,7 @@
 from pathlib import Path
 
 from operations.models import MarkdownReference
+from operations.text_utils import REFERENCE_RES
 from operations.update_references import (
     REASON_NO_REWRITE,
     REASON_TEXT_NOT_FOUND,
@@ -152,6 +153,18 @@ def should_update_multiple_references_in_same_file(tmp_path, mock_markdown_files
     assert "[Link](new.png)" in written_content
 
 
+def should_keep_backslashes_in_rewritten_paths_literal(tmp_path, mock_markdown_files):
+    md_file = tmp_path / "windows.md"
+
+    mock_markdown_files.read_markdown_content.return_value = "![Alt](images\\old.png)\n"
+    refs = [_make_ref(md_file, 1, "![Alt](images\\old.png)", "images/old.png", "image")]
+
+    result = update_references(refs, "old.png", "new.png", mock_markdown_files)
+
+    assert result.updates[0].replacement_count == 1
+    mock_markdown_files.write_markdown_content.assert_called_once_with(md_file, "![Alt](images\\new.png)\n")
+
+
 def should_update_references_in_multiple_files(tmp_path, mock_markdown_files):
     file1 = tmp_path / "doc1.md"
     file2 = tmp_path / "doc2.md"
@@ -337,13 +350,13 @@ def should_return_needle_when_no_match_in_find_substring():
 
 
 def should_return_none_for_malformed_standard_ref():
-    result = _replace_standard_ref(r'!\[([^\]]*)\]\(([^)]+)\)', "!", "not a standard ref", "old.png", "new.png")
+    result = _replace_standard_ref(REFERENCE_RES['image'], "!", "not a standard ref", "old.png", "new.png")
 
     assert result is None
 
 
 def should_return_none_for_malformed_wiki_ref():
-    result = _replace_wiki_ref(r'!\[\[([^\]|]+)(?:\|([^\]]+))?\]\]', "!", "not a wiki ref", "old.png", "new.png")
+    result = _replace_wiki_ref(REFERENCE_RES['wiki_embed'], "!", "not a wiki ref", "old.png", "new.png")
 
     assert result is None
 
@@ -373,6 +386,15 @@ def should_log_warning_when_url_decode_fails(mocker):
     warning_spy.assert_called_once()
 
 
+def should_replace_plain_paths_without_url_decoding(mocker):
+    unquote_spy = mocker.patch("operations.update_references.unquote")
+
+    result = _replace_in_path("images/old name.png", "old name.png", "new-name.png")
+
+    assert result == "images/new-name.png"
+    unquote_spy.assert_not_called()
+
+
 def should_return_empty_updates_and_not_raise_when_read_raises_permission_error(tmp_path, mock_markdown_files):
     md_file = tmp_path / "doc.md"
     ref = _make_ref(md_file, 1, "![Photo](old.png)", "old.png", "image")
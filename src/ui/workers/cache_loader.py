@@ -5,6 +5,7 @@ Proactively loads cache to give user early feedback on what's already been proce
 
 from PySide6.QtCore import QThread, Signal
 
+from operations.models import PlannedNames
 from operations.ports import AnalysisCachePort
 from operations.process_image import build_processing_result
 from ui.models.ui_models import RenameItem
@@ -40,7 +41,7 @@ class CacheLoaderWorker(QThread):
     def run(self) -> None:
         """Load cached data for each item."""
         cached_count = 0
-        planned_names: set[str] = set()
+        planned_names = PlannedNames()
 
         for i, item in enumerate(self.items):
             if self._stop_requested:
@@ -7,7 +7,7 @@ from pathlib import Path
 
 from PySide6.QtCore import QThread, Signal
 
-from operations.models import FolderStatistics, ImageAnalysis, ProcessingResult, RenameStatus
+from operations.models import FolderStatistics, ImageAnalysis, PlannedNames, ProcessingResult, RenameStatus
 from operations.ports import AnalysisCachePort, ImageAnalyzerPort
 from operations.process_folder import compute_statistics
 from operations.process_image import process_single_image
@@ -77,7 +77,7 @@ class RenameWorker(QThread):
 
     def run(self) -> None:
         """Process items, emitting signals for real-time UI updates."""
-        planned_names: set[str] = set()
+        planned_names = PlannedNames()
         results: list[ProcessingResult] = []
 
         for i, item in enumerate(self.items):
@@ -7,7 +7,7 @@ pytest.importorskip("PySide6")
 from pathlib import Path  # noqa: E402
 from unittest.mock import Mock  # noqa: E402
 
-from operations.models import FolderStatistics, ProcessingResult, RenameStatus  # noqa: E402
+from operations.models import FolderStatistics, PlannedNames, ProcessingResult, RenameStatus  # noqa: E402
 from operations.ports import AnalysisCachePort, ImageAnalyzerPort  # noqa: E402
 from ui.models.ui_models import ItemStatus, RenameItem  # noqa: E402
 from ui.workers.rename_worker import RenameWorker  # noqa: E402
@@ -81,7 +81,7 @@ def should_call_process_single_image_for_normal_item(tmp_path, qapp, mocker):
     assert call_args[0][0] == item.path
     assert call_args[0][1] is analyzer
     assert call_args[0][2] is cache
-    assert isinstance(call_args[0][3], set)
+    assert isinstance(call_args[0][3], PlannedNames)
     assert len(received["item_processed"]) == 1
     assert len(received["progress_updated"]) == 1
     stats: FolderStatistics = received["finished"][0]
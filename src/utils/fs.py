@@ -1,27 +1,58 @@
 """Filesystem utilities for image-namer."""
 
 
+import functools
 import hashlib
+import logging
+import os
 import sys
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Final
 
 from constants import RUBRIC_VERSION, SUPPORTED_EXTENSIONS
 
+logger = logging.getLogger(__name__)
+
 # Top-level cache directory name (dot folder in repo root)
 CACHE_ROOT_NAME: Final[str] = ".image_namer"
 
 
+def _read_umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Mode a plain open() would give a new file. The umask can only be read by
+# setting it, which is not thread-safe, so read it once at import.
+DEFAULT_FILE_MODE: Final[int] = 0o666 & ~_read_umask()
+
+
 def sha256_file(path: Path) -> str:
     """Compute the SHA-256 hex digest of a file's contents.
 
-    Streams the file in chunks to support large files without high memory usage.
+    Streams the file through ``hashlib.file_digest`` to support large files
+    without high memory usage.
     """
-    h = hashlib.sha256()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def sha256_file_cached(path: Path) -> str:
+    """Compute the SHA-256 hex digest of a file, memoized on its stat identity.
+
+    The memo key is (path, device, inode, size, mtime), so a cache lookup and
+    the save that follows it hash an image once, while any rewrite of the
+    file yields a fresh key and a fresh digest.
+    """
+    st = path.stat()
+    return _sha256_for_identity(os.fspath(path), st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=1024)
+def _sha256_for_identity(path: str, dev: int, ino: int, size: int, mtime_ns: int) -> str:
+    return sha256_file(Path(path))
 
 
 def ensure_cache_layout(repo_root: Path) -> Path:
@@ -46,6 +77,25 @@ def ensure_cache_layout(repo_root: Path) -> Path:
     return cache_root
 
 
+def list_dir_names(dir: Path) -> frozenset[str]:
+    """Return the names of all entries in dir, or an empty set if it does not exist."""
+    try:
+        with os.scandir(dir) as entries:
+            return frozenset(entry.name for entry in entries)
+    except FileNotFoundError:
+        return frozenset()
+
+
+def normalize_name(name: str, case_insensitive: bool | None = None) -> str:
+    """Fold a filename the way collision checks compare names.
+
+    Names are lowercased when ``case_insensitive`` is true, which defaults to
+    macOS (Darwin) to align with its case-insensitive filesystem.
+    """
+    _case_insensitive = sys.platform == "darwin" if case_insensitive is None else case_insensitive
+    return name.lower() if _case_insensitive else name
+
+
 def next_available_name(
     dir: Path,
     stem: str,
@@ -62,42 +112,110 @@ def next_available_name(
     On macOS (Darwin), the check is case-insensitive to align with the default
     case-insensitive filesystem behavior.
     """
+    existing_norm = frozenset(normalize_name(name, case_insensitive) for name in list_dir_names(dir))
+    planned_norm = frozenset(normalize_name(name, case_insensitive) for name in planned_names)
+    return probe_available_name(stem, ext, existing_norm, planned_norm, case_insensitive)
+
+
+def probe_available_name(
+    stem: str,
+    ext: str,
+    existing_norm: set[str] | frozenset[str],
+    planned_norm: set[str] | frozenset[str],
+    case_insensitive: bool | None = None,
+    next_suffix: dict[str, int] | None = None,
+) -> str:
+    """Return the first candidate name that is neither existing nor planned.
+
+    Like ``next_available_name``, but checks names already folded with
+    ``normalize_name`` (using the same ``case_insensitive``), so callers
+    resolving many names can normalize a directory snapshot once instead of
+    on every call.
+
+    When ``next_suffix`` is given, probing starts at the suffix recorded by the
+    previous call and the dict is updated with the next one to try, so N images
+    proposing the same name cost O(N) probes instead of O(N²). Only pass it for
+    a single directory, alongside a ``planned_norm`` set that every returned
+    name is added to; otherwise skipped suffixes may still be free.
+    """
     # Normalize extension to include leading dot if provided and not empty
     if not ext:
         extension = ""
     else:
         extension = ext if ext.startswith(".") else f".{ext}"
 
-    _case_insensitive = sys.platform == "darwin" if case_insensitive is None else case_insensitive
-
-    # Normalize list of existing filenames in the directory
-    try:
-        existing = {p.name for p in dir.iterdir()}
-    except FileNotFoundError:
-        existing = set()
-
-    def normalize(name: str) -> str:
-        return name.lower() if _case_insensitive else name
-
-    existing_norm = {normalize(name) for name in existing}
-    planned_norm = {normalize(name) for name in planned_names}
-
     def candidate(n: int) -> str:
         s = stem if n == 1 else f"{stem}-{n}"
         return f"{s}{extension}"
 
-    n = 1
+    suffix_key = normalize_name(candidate(1), case_insensitive)
+    n = next_suffix.get(suffix_key, 1) if next_suffix is not None else 1
     while True:
         name = candidate(n)
-        if normalize(name) not in existing_norm and normalize(name) not in planned_norm:
+        name_norm = normalize_name(name, case_insensitive)
+        if name_norm not in existing_norm and name_norm not in planned_norm:
+            if next_suffix is not None:
+                next_suffix[suffix_key] = n + 1
             return name
         n += 1
 
 
+def image_extension(name: str) -> str:
+    """Return the lowercased extension of a file name, including the dot.
+
+    Mirrors ``PurePath.suffix`` (a leading dot marks a hidden file and a
+    trailing dot is not an extension) but works on the bare name with a single
+    split, so callers holding a directory entry name need not build a ``Path``.
+    """
+    dot = name.rfind(".")
+    return name[dot:].lower() if 0 < dot < len(name) - 1 else ""
+
+
+def _has_supported_extension(name: str) -> bool:
+    return image_extension(name) in SUPPORTED_EXTENSIONS
+
+
+def iter_image_files(path: Path, recursive: bool) -> Iterator[Path]:
+    """Yield image files in path with supported extensions, in directory order.
+
+    Filters on the directory entry name before building a ``Path``, so
+    non-image entries cost no allocation or extra ``stat``. Symlinked
+    directories are not descended into. An unreadable ``path`` raises
+    ``OSError``; unreadable subdirectories are logged and skipped.
+    """
+    return _iter_files(path, recursive, _has_supported_extension)
+
+
+def iter_markdown_files(path: Path, recursive: bool) -> Iterator[Path]:
+    """Yield ``.md`` files in path, in directory order, walking like ``iter_image_files``.
+
+    The extension match follows ``os.path.normcase`` (case-insensitive only on
+    Windows), as ``Path.glob("*.md")`` does.
+    """
+    return _iter_files(path, recursive, _is_markdown_name)
+
+
+def _is_markdown_name(name: str) -> bool:
+    return os.path.normcase(name).endswith(".md")
+
+
+def _iter_files(path: Path, recursive: bool, accept_name: Callable[[str], bool]) -> Iterator[Path]:
+    pending = [os.fspath(path)]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif accept_name(entry.name) and entry.is_file():
+                        yield Path(entry.path)
+        except OSError as e:
+            if current == os.fspath(path):
+                raise
+            logger.warning("Skipping unreadable directory %s: %s: %s", current, type(e).__name__, e)
+
+
 def collect_image_files(path: Path, recursive: bool) -> list[Path]:
-    """Collect all image files in path with supported extensions."""
-    if recursive:
-        files = [p for p in path.rglob("*") if p.is_file() and p.suffix.lower() in SUPPORTED_EXTENSIONS]
-    else:
-        files = [p for p in path.iterdir() if p.is_file() and p.suffix.lower() in SUPPORTED_EXTENSIONS]
-    return sorted(files)
+    """Collect all image files in path with supported extensions, sorted by path."""
+    return sorted(iter_image_files(path, recursive))
@@ -1,7 +1,16 @@
 import hashlib
 from pathlib import Path
 
-from utils.fs import collect_image_files, ensure_cache_layout, next_available_name, sha256_file
+from utils.fs import (
+    collect_image_files,
+    ensure_cache_layout,
+    image_extension,
+    iter_image_files,
+    iter_markdown_files,
+    next_available_name,
+    sha256_file,
+    sha256_file_cached,
+)
 from constants import RUBRIC_VERSION
 
 
@@ -105,3 +114,68 @@ def should_handle_nonexistent_directory_as_empty(tmp_path: Path) -> None:
     result = next_available_name(nonexistent, "photo", ".png")
 
     assert result == "photo.png"
+
+
+def should_collect_uppercase_extensions(tmp_path: Path) -> None:
+    (tmp_path / "PHOTO.JPG").write_bytes(b"x")
+
+    files = collect_image_files(tmp_path, recursive=False)
+
+    assert [f.name for f in files] == ["PHOTO.JPG"]
+
+
+def should_skip_directories_and_dotfiles_named_like_images(tmp_path: Path) -> None:
+    (tmp_path / "album.png").mkdir()
+    (tmp_path / ".png").write_bytes(b"x")
+
+    files = collect_image_files(tmp_path, recursive=True)
+
+    assert files == []
+
+
+def should_yield_only_image_files_from_iterator(tmp_path: Path) -> None:
+    (tmp_path / "a.png").write_bytes(b"x")
+    (tmp_path / "notes.md").write_text("text")
+
+    files = list(iter_image_files(tmp_path, recursive=False))
+
+    assert files == [tmp_path / "a.png"]
+
+
+def should_lowercase_extension_like_path_suffix() -> None:
+    for name in ["photo.PNG", "archive.tar.JPG", ".hidden", "noext", "trailing."]:
+        assert image_extension(name) == Path(name).suffix.lower()
+
+
+def should_hash_unchanged_file_once_when_cached(tmp_path: Path, mocker) -> None:
+    p = tmp_path / "a.bin"
+    p.write_bytes(b"hello world")
+    spy = mocker.patch("utils.fs.sha256_file", wraps=sha256_file)
+
+    first = sha256_file_cached(p)
+    second = sha256_file_cached(p)
+
+    assert first == second == hashlib.sha256(b"hello world").hexdigest()
+    spy.assert_called_once()
+
+
+def should_rehash_file_after_content_changes_when_cached(tmp_path: Path) -> None:
+    p = tmp_path / "a.bin"
+    p.write_bytes(b"hello")
+    before = sha256_file_cached(p)
+
+    p.write_bytes(b"hello, changed")
+
+    assert sha256_file_cached(p) != before
+    assert sha256_file_cached(p) == hashlib.sha256(b"hello, changed").hexdigest()
+
+
+def should_yield_only_markdown_files_not_directories(tmp_path: Path) -> None:
+    (tmp_path / "notes.md").write_text("# Notes")
+    (tmp_path / "archive.md").mkdir()
+    (tmp_path / "archive.md" / "old.md").write_text("# Old")
+    (tmp_path / "readme.txt").write_text("text")
+
+    result = sorted(p.relative_to(tmp_path) for p in iter_markdown_files(tmp_path, recursive=True))
+
+    assert result == [Path("archive.md/old.md"), Path("notes.md")]
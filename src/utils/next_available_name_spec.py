@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from utils.fs import next_available_name
+from utils.fs import list_dir_names, next_available_name, normalize_name, probe_available_name
 
 
 def should_pick_next_numeric_suffix(tmp_path: Path) -> None:
@@ -36,3 +36,46 @@ def should_skip_both_disk_and_planned_collisions(tmp_path: Path) -> None:
     result = next_available_name(tmp_path, "photo", ".png", planned_names={"photo-2.png"})
 
     assert result == "photo-3.png"
+
+
+def should_resume_probing_from_recorded_suffix() -> None:
+    next_suffix = {"photo.png": 5}
+
+    result = probe_available_name("photo", ".png", frozenset(), set(), next_suffix=next_suffix)
+
+    assert result == "photo-5.png"
+
+
+def should_record_next_suffix_after_resolving() -> None:
+    next_suffix: dict[str, int] = {}
+
+    probe_available_name("photo", ".png", frozenset({"photo.png"}), set(), next_suffix=next_suffix)
+
+    assert next_suffix == {"photo.png": 3}
+
+
+def should_probe_against_given_names_without_listing_directory() -> None:
+    result = probe_available_name("photo", ".png", frozenset({"photo-2.png"}), frozenset())
+
+    assert result == "photo.png"
+
+
+def should_probe_pre_normalized_names_case_insensitively() -> None:
+    result = probe_available_name(
+        "Photo", ".png", frozenset({"photo.png"}), {"photo-2.png"}, case_insensitive=True,
+    )
+
+    assert result == "Photo-3.png"
+
+
+def should_lowercase_names_only_when_case_insensitive() -> None:
+    assert normalize_name("Photo.PNG", case_insensitive=True) == "photo.png"
+    assert normalize_name("Photo.PNG", case_insensitive=False) == "Photo.PNG"
+
+
+def should_list_directory_entry_names(tmp_path: Path) -> None:
+    (tmp_path / "photo.png").write_bytes(b"x")
+    (tmp_path / "sub").mkdir()
+
+    assert list_dir_names(tmp_path) == frozenset({"photo.png", "sub"})
+    assert list_dir_names(tmp_path / "missing") == frozenset()